@@ -2,22 +2,29 @@
 YouTube Audio Transcriber 웹 애플리케이션
 """
 from fastapi import FastAPI, Form, HTTPException, BackgroundTasks, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, FileResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 import uvicorn
 import os
-from audio_extractor import YouTubeAudioExtractor
+from audio_extractor import YouTubeAudioExtractor, parse_youtube_video_id
 from speech_transcriber import SpeechTranscriber
+import text_summarizer
 import uuid
-from datetime import datetime
-from transformers import pipeline
+from datetime import datetime, timedelta
 from pydantic import BaseModel
-import torch
 from dotenv import load_dotenv
 import google.generativeai as genai
 import asyncio
-import json
+import orjson
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+from functools import lru_cache
+import numpy as np
 
 # --- Environment Setup ---
 load_dotenv()
@@ -39,42 +46,356 @@ app = FastAPI(
     version="3.1.0",
     description="고품질 AI를 사용한 YouTube 음성-텍스트 변환 및 요약 서비스 (OpenAI 통합)",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
+# 긴 스크립트/요약 응답 압축 (brotli-asgi가 설치되어 있으면 Brotli 우선)
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # --- Static Files and Templates ---
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
 # --- Global Objects ---
 extractor = YouTubeAudioExtractor()
-transcriber = SpeechTranscriber()
 
-# Load summarization model at startup
-print("🔄 안정화된 한국어 요약 모델을 로드하는 중입니다...")
-try:
-    # 안정적인 T5 모델 사용 (긴 텍스트 처리 가능)
-    summarizer = pipeline("summarization", 
-                         model="eenzeenee/t5-small-korean-summarization",
-                         max_length=1024,  # 최대 길이 제한
-                         truncation=True)
-    print("✅ T5 한국어 요약 모델 로드 완료!")
-except Exception as e:
-    summarizer = None
-    print(f"❌ 요약 모델 로드 실패: {e}")
-    print("   요약 기능 없이 애플리케이션을 시작합니다.")
+# Whisper 모델 캐시 (모델명 -> SpeechTranscriber, LRU)
+MAX_CACHED_MODELS = int(os.getenv("MAX_CACHED_MODELS", "2"))
+TRANSCRIBER_CACHE: "OrderedDict[str, SpeechTranscriber]" = OrderedDict()
+# 모델별로 마지막에 Google 인식이 성공한 언어 (다음 작업에서 먼저 시도해 실패하는 왕복을 줄임)
+# 공유 SpeechTranscriber 인스턴스가 아니라 이벤트 루프에서만 읽고 쓰는 앱 상태로 보관
+GOOGLE_LANGUAGE_HINTS: "dict[str, str]" = {}
+# 로드 중인 모델 (모델명 -> 로드 Task): 같은 모델을 기다리는 요청만 대기, 다른 모델 로드는 막지 않음
+_transcriber_loads: "dict[str, asyncio.Task]" = {}
+# 서버 시작 시 미리 로드할 Whisper 모델 (웹 폼 기본값, 빈 값이면 첫 요청 때 로드)
+WHISPER_PREWARM_MODEL = os.getenv("WHISPER_PREWARM_MODEL", "base")
+
+# 동시 실행 제한 (다운로드는 I/O 위주, Whisper는 GPU/CPU 메모리에 맞춰 조정)
+DOWNLOAD_CONCURRENCY = int(os.getenv("DOWNLOAD_CONCURRENCY", "4"))
+WHISPER_SEM = asyncio.Semaphore(int(os.getenv("WHISPER_CONCURRENCY", "1")))
+DOWNLOAD_SEM = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
+# yt-dlp 호출 전용 스레드 풀 (기본 executor와 분리해 다운로드가 몰려도 다른 작업을 막지 않음)
+EXTRACT_POOL = ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY, thread_name_prefix="yt-dlp")
+
+
+async def run_extract(func, *args):
+    """yt-dlp 블로킹 호출을 EXTRACT_POOL에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXTRACT_POOL, func, *args)
+
+# YouTube 비디오 ID 기준 추출된 오디오 파일 캐시 (LRU)
+# 비디오 정보는 extractor 내부의 TTL 캐시 하나만 사용
+MAX_CACHED_AUDIO = 32
+AUDIO_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+AUDIO_IN_USE: Counter = Counter()  # 오디오 파일 경로 -> 그 파일로 변환 중인 작업 수
+# 진행 중인 추출 ((비디오 ID, 포맷) -> 추출 Task): 같은 영상/포맷 요청은 다운로드 하나를 공유
+_audio_extractions: "dict[tuple, asyncio.Task]" = {}
+
+
+async def extract_audio_cached(url: str, format: str, video_info: dict = None):
+    """비디오 ID 캐시를 거쳐 오디오 추출 (캐시된 파일은 재다운로드하지 않음)"""
+    video_id = parse_youtube_video_id(url)
+    cache_key = (video_id, format)
+    if video_id and cache_key in AUDIO_CACHE:
+        cached_path = AUDIO_CACHE[cache_key]
+        if os.path.exists(cached_path):
+            AUDIO_CACHE.move_to_end(cache_key)
+            return cached_path
+        del AUDIO_CACHE[cache_key]
+    if not video_id:
+        return await _extract_audio(url, format, video_info, None)
+
+    extraction = _audio_extractions.get(cache_key)
+    if extraction is None:
+        extraction = _audio_extractions[cache_key] = asyncio.create_task(
+            _extract_audio(url, format, video_info, cache_key))
+        extraction.add_done_callback(lambda _: _audio_extractions.pop(cache_key, None))
+    # 기다리던 요청이 취소되어도 함께 기다리는 다른 요청의 다운로드는 계속 진행
+    return await asyncio.shield(extraction)
+
+
+async def _extract_audio(url: str, format: str, video_info: dict = None, cache_key: tuple = None):
+    """DOWNLOAD_SEM 안에서 오디오를 추출하고 cache_key가 있으면 AUDIO_CACHE에 등록"""
+    async with DOWNLOAD_SEM:
+        audio_path = await run_extract(extractor.extract_audio, url, format, video_info)
+    if cache_key and audio_path:
+        AUDIO_CACHE[cache_key] = audio_path
+        while len(AUDIO_CACHE) > MAX_CACHED_AUDIO:
+            _, evicted_path = AUDIO_CACHE.popitem(last=False)
+            discard_audio_if_unused(evicted_path)
+    return audio_path
+
+
+def remember_google_language(model: str, method: str, result: dict):
+    """Google 인식이 성공했으면 그 언어를 같은 모델의 다음 작업에서 먼저 시도하도록 기록"""
+    if method not in ('google', 'both'):
+        return
+    google_result = result.get('google', {}) if method == 'both' else result
+    if google_result.get('success') and google_result.get('language'):
+        GOOGLE_LANGUAGE_HINTS[model] = google_result['language']
+
+
+def discard_audio_if_unused(audio_path: str):
+    """다른 캐시 항목도, 실행 중인 작업도 쓰지 않는 오디오 파일만 삭제"""
+    if AUDIO_IN_USE[audio_path] or audio_path in AUDIO_CACHE.values():
+        return
+    AUDIO_IN_USE.pop(audio_path, None)
+    if os.path.exists(audio_path):
+        os.remove(audio_path)
+
+
+async def get_or_load_transcriber(model_name: str) -> SpeechTranscriber:
+    """모델명별로 캐시된 SpeechTranscriber 반환 (없으면 로드)"""
+    transcriber_instance = TRANSCRIBER_CACHE.get(model_name)
+    if transcriber_instance is not None:
+        TRANSCRIBER_CACHE.move_to_end(model_name)
+        return transcriber_instance
+
+    load = _transcriber_loads.get(model_name)
+    if load is None:
+        load = _transcriber_loads[model_name] = asyncio.create_task(_load_transcriber(model_name))
+        # 실패한 로드는 다음 요청이 다시 시도하도록 완료 시 제거
+        load.add_done_callback(lambda _: _transcriber_loads.pop(model_name, None))
+    # 기다리던 요청이 취소되어도 다른 요청이 함께 기다리는 로드는 계속 진행
+    return await asyncio.shield(load)
+
+
+async def _load_transcriber(model_name: str) -> SpeechTranscriber:
+    """SpeechTranscriber를 만들어 모델을 로드하고 캐시에 등록"""
+    transcriber_instance = SpeechTranscriber(model_name=model_name)
+    # 모델 로드는 블로킹 작업이므로 스레드에서 실행
+    await asyncio.to_thread(transcriber_instance.load_whisper_model)
+    TRANSCRIBER_CACHE[model_name] = transcriber_instance
+    while len(TRANSCRIBER_CACHE) > MAX_CACHED_MODELS:
+        evicted_name, _ = TRANSCRIBER_CACHE.popitem(last=False)
+        print(f"🗑️  Whisper {evicted_name} 모델 캐시에서 제거")
+    return transcriber_instance
+
+
+# 요약 실행기: SUMMARIZER_PROCESSES > 0 이면 워커 프로세스마다 모델을 로드해 GIL을 우회,
+# 아니면 startup 시 이 프로세스에서 모델을 로드하고 스레드풀에서 실행
+SUMMARIZER_PROCESSES = int(os.getenv("SUMMARIZER_PROCESSES", "0"))
+summary_pool = None
+
+
+async def run_summary(kind: str, text: str):
+    """요약 실행 (프로세스 풀 또는 스레드풀)"""
+    if summary_pool is not None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(summary_pool, text_summarizer.run_summary, kind, text)
+    return await run_in_threadpool(text_summarizer.run_summary, kind, text)
+
+
+# Job store: REDIS_URL이 설정되면 Redis 사용 (uvicorn --workers N 지원), 아니면 메모리
+REDIS_URL = os.getenv("REDIS_URL")
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "86400"))
+redis_client = None
+if REDIS_URL:
+    try:
+        import redis.asyncio as redis_asyncio
+        redis_client = redis_asyncio.Redis.from_url(REDIS_URL)
+        print(f"🗄️  Redis 작업 저장소 사용: {REDIS_URL}")
+    except ImportError:
+        print("⚠️  redis 패키지가 없어 메모리 작업 저장소를 사용합니다.")
+
+# In-memory job store (크기 제한 LRU, 오래된 작업은 주기적으로 정리)
+JOBS_MAX = int(os.getenv("JOBS_MAX", "1024"))
+JOB_GC_INTERVAL_SECONDS = 300
+jobs: "OrderedDict[str, dict]" = OrderedDict()
+
+
+async def save_job(job_id: str, state: dict):
+    """작업 상태 저장"""
+    if redis_client is not None:
+        await redis_client.set(f"job:{job_id}", orjson.dumps(state), ex=JOB_TTL_SECONDS)
+    else:
+        jobs[job_id] = state
+        jobs.move_to_end(job_id)
+        while len(jobs) > JOBS_MAX:
+            jobs.popitem(last=False)
+
+
+def purge_expired_jobs() -> int:
+    """JOB_TTL_SECONDS보다 오래된 메모리 작업 삭제 (삭제된 개수 반환)"""
+    cutoff = datetime.now() - timedelta(seconds=JOB_TTL_SECONDS)
+    # created_at이 없는 항목은 판단할 수 없으므로 건너뜀 (LRU 제한으로만 정리)
+    expired = [job_id for job_id, state in jobs.items()
+               if state.get('created_at') and datetime.fromisoformat(state['created_at']) < cutoff]
+    for job_id in expired:
+        del jobs[job_id]
+    return len(expired)
+
+
+async def gc_jobs():
+    """만료된 작업을 주기적으로 정리 (Redis는 키 TTL로 자동 만료)"""
+    while True:
+        await asyncio.sleep(JOB_GC_INTERVAL_SECONDS)
+        try:
+            removed = purge_expired_jobs()
+        except Exception as e:
+            # 항목 하나의 오류로 정리 태스크 전체가 멈추지 않도록 다음 주기에 다시 시도
+            print(f"⚠️  작업 정리 실패: {e}")
+            continue
+        if removed:
+            print(f"🧹 만료된 작업 {removed}개 정리")
+
+
+async def get_job(job_id: str):
+    """작업 상태 조회 (없으면 None)"""
+    if redis_client is not None:
+        data = await redis_client.get(f"job:{job_id}")
+        return orjson.loads(data) if data else None
+    return jobs.get(job_id)
+
+
+# 작업별 상태 변경 알림 (SSE 스트림을 즉시 깨우기 위함)
+JOB_EVENTS = {}
+STATUS_STREAM_FALLBACK_SECONDS = 1.0
+
+
+def _notify_job(job_id: str):
+    """상태 변경을 기다리는 SSE 스트림 깨우기"""
+    event = JOB_EVENTS.pop(job_id, None)
+    if event is not None:
+        event.set()
+
+
+def job_channel(job_id: str) -> str:
+    """작업 상태 변경을 알리는 Redis pub/sub 채널명"""
+    return f"job_events:{job_id}"
+
+
+async def update_job(job_id: str, **fields):
+    """작업 상태 일부 갱신 (LRU/TTL로 이미 삭제된 작업은 다시 만들지 않음)"""
+    state = await get_job(job_id)
+    if state is None:
+        _notify_job(job_id)
+        return
+    state.update(fields)
+    await save_job(job_id, state)
+    _notify_job(job_id)
+    if redis_client is not None:
+        # 다른 워커에서 열린 SSE 스트림도 바로 깨우기
+        await redis_client.publish(job_channel(job_id), "1")
+
+
+async def job_status_events(job_id: str):
+    """작업 상태가 바뀔 때마다 SSE 이벤트 생성 (완료되면 종료)"""
+    last_payload = None
+    pubsub = None
+    if redis_client is not None:
+        pubsub = redis_client.pubsub()
+        await pubsub.subscribe(job_channel(job_id))
+    try:
+        while True:
+            event = JOB_EVENTS.setdefault(job_id, asyncio.Event())
+            job = await get_job(job_id)
+            if job is None:
+                break
+            payload = orjson.dumps(job).decode()
+            if payload != last_payload:
+                last_payload = payload
+                yield f"data: {payload}\n\n"
+            if job.get('completed'):
+                break
+            if pubsub is not None:
+                # 다른 워커의 갱신은 Redis pub/sub으로 수신 (놓친 경우를 위해 주기적으로도 확인)
+                await pubsub.get_message(ignore_subscribe_messages=True,
+                                         timeout=STATUS_STREAM_FALLBACK_SECONDS)
+                continue
+            try:
+                await asyncio.wait_for(event.wait(), timeout=STATUS_STREAM_FALLBACK_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if pubsub is not None:
+            await pubsub.reset()
+
+# 요약 결과 캐시 (입력 텍스트 해시 + 엔드포인트 -> 결과, LRU)
+MAX_CACHED_SUMMARIES = 128
+SUMMARY_CACHE: "OrderedDict[str, object]" = OrderedDict()
+
+
+def summary_cache_key(endpoint: str, text: str) -> str:
+    """요약 캐시 키 생성"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest() + ":" + endpoint
+
+
+def get_cached_summary(cache_key: str):
+    """캐시된 요약 결과 반환 (없으면 None)"""
+    cached = SUMMARY_CACHE.get(cache_key)
+    if cached is not None:
+        SUMMARY_CACHE.move_to_end(cache_key)
+    return cached
+
+
+def store_summary(cache_key: str, content) -> None:
+    """요약 결과를 캐시에 저장"""
+    SUMMARY_CACHE[cache_key] = content
+    SUMMARY_CACHE.move_to_end(cache_key)
+    while len(SUMMARY_CACHE) > MAX_CACHED_SUMMARIES:
+        SUMMARY_CACHE.popitem(last=False)
+
+
+def cache_summary(cache_key: str, content) -> ORJSONResponse:
+    """요약 결과를 캐시에 저장하고 응답 생성"""
+    store_summary(cache_key, content)
+    return ORJSONResponse(content=content)
+
+
+# 토큰 단위 실시간 스트림: 압축 미들웨어가 조각을 모아두지 않도록 Content-Encoding을 미리 지정
+LIVE_STREAM_HEADERS = {"Content-Encoding": "identity", "Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 
+def ndjson_response(items) -> StreamingResponse:
+    """이미 준비된 요약 배열을 NDJSON(한 줄에 항목 하나)으로 응답"""
+    async def lines():
+        for item in items:
+            yield orjson.dumps(item) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
-# In-memory job store
-jobs = {}
+
+# Gemini 결과 의미 캐시: 거의 같은 스크립트(임베딩 코사인 유사도 >= 임계값)는 API 재호출 없이 재사용
+SEMANTIC_CACHE_MODEL = os.getenv("SEMANTIC_CACHE_MODEL")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+semantic_encoder = None
+SEMANTIC_CACHE: "dict[str, list]" = {}  # 엔드포인트 -> [(정규화된 임베딩, 결과), ...]
+
+
+async def semantic_cache_lookup(endpoint: str, text: str):
+    """(임베딩, 유사한 캐시 결과 또는 None) 반환 (의미 캐시가 꺼져 있으면 (None, None))"""
+    if semantic_encoder is None:
+        return None, None
+    embedding = await run_in_threadpool(semantic_encoder.encode, text, normalize_embeddings=True)
+    entries = SEMANTIC_CACHE.get(endpoint)
+    if entries:
+        scores = np.stack([vector for vector, _ in entries]) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] >= SEMANTIC_CACHE_THRESHOLD:
+            print(f"🧠 의미 캐시 적중 ({endpoint}, 유사도 {scores[best]:.3f})")
+            return embedding, entries[best][1]
+    return embedding, None
+
+
+def semantic_cache_store(endpoint: str, embedding, content):
+    """Gemini 결과를 의미 캐시에 저장 (엔드포인트별 MAX_CACHED_SUMMARIES개 유지)"""
+    if embedding is None:
+        return
+    entries = SEMANTIC_CACHE.setdefault(endpoint, [])
+    entries.append((embedding, content))
+    if len(entries) > MAX_CACHED_SUMMARIES:
+        del entries[0]
 
 # --- Google Gemini 요약 함수들 ---
-async def gemini_summarize_key_points(text: str):
-    """Google Gemini를 사용한 핵심요약"""
-    try:
-        model = genai.GenerativeModel(GEMINI_MODEL)
-        
-        prompt = f"""
+def build_key_points_prompt(text: str) -> str:
+    """핵심요약 프롬프트 생성"""
+    return f"""
 당신은 전문 텍스트 요약 전문가입니다. 주어진 유튜브 스크립트를 분석하여 각 문단의 핵심 내용을 정확하고 간결하게 요약해주세요.
 
 지시사항:
@@ -93,8 +414,122 @@ async def gemini_summarize_key_points(text: str):
   ...
 ]
 """
+
+
+def build_timeline_prompt(text: str) -> str:
+    """타임라인 요약 프롬프트 생성"""
+    return f"""
+당신은 전문 영상 편집자이자 요약 전문가입니다. 주어진 유튜브 스크립트를 시간 흐름에 따라 구간별로 나누어 타임라인 형태로 정리해주세요.
+
+지시사항:
+1. 내용의 흐름에 따라 4-8개의 구간으로 나누세요
+2. 각 구간에 대해 다음 정보를 제공하세요:
+   - timestamp: "X-Y분" 형태의 시간대
+   - subtitle: 해당 구간의 핵심 주제 (간결한 제목)
+   - summary: 구간 내용의 상세 요약 (2-3문장)
+   - keywords: 핵심 키워드 3-5개
+   - oneline_summary: 구어체로 한 문장 정리
+
+텍스트:
+{text}
+
+응답을 JSON 배열 형태로만 제공해주세요:
+[
+  {{
+    "timestamp": "0-3분",
+    "subtitle": "구간 제목",
+    "summary": "구간 내용 요약",
+    "keywords": ["키워드1", "키워드2", "키워드3"],
+    "oneline_summary": "구어체로 한 줄 정리"
+  }},
+  ...
+]
+"""
+
+
+async def gemini_stream_text(prompt: str, temperature: float, max_output_tokens: int):
+    """Gemini 응답을 토큰이 도착하는 대로 텍스트 조각으로 반환"""
+    model = genai.GenerativeModel(GEMINI_MODEL)
+    response = await model.generate_content_async(
+        prompt,
+        generation_config=genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+        ),
+        stream=True
+    )
+    async for chunk in response:
+        yield chunk.text
+
+
+async def iter_json_array_items(chunks):
+    """스트리밍 텍스트에서 최상위 JSON 배열의 원소를 완성되는 대로 하나씩 반환 (코드 블록 표시는 무시)"""
+    buffer = ""
+    pos = 0
+    depth = 0
+    item_start = None
+    in_string = False
+    escaped = False
+    async for chunk in chunks:
+        buffer += chunk
+        while pos < len(buffer):
+            ch = buffer[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "[{":
+                depth += 1
+                if depth == 2:
+                    item_start = pos
+            elif ch in "]}":
+                if depth == 2 and item_start is not None:
+                    yield orjson.loads(buffer[item_start:pos + 1])
+                    buffer = buffer[pos + 1:]
+                    pos = 0
+                    item_start = None
+                    depth -= 1
+                    continue
+                depth -= 1
+            pos += 1
+
+
+async def stream_gemini_summary(kind: str, cache_key: str, embedding, text: str,
+                                prompt: str, temperature: float, max_output_tokens: int):
+    """Gemini 배열 요약을 항목 단위 NDJSON으로 스트리밍 (실패 시 T5/규칙 기반 결과로 대체)"""
+    items = []
+    try:
+        async for item in iter_json_array_items(gemini_stream_text(prompt, temperature, max_output_tokens)):
+            items.append(item)
+            yield orjson.dumps(item) + b"\n"
+    except Exception as e:
+        print(f"Gemini 스트리밍 요약 오류: {e}")
+        if items:
+            return  # 일부만 전송된 결과는 캐시하지 않음
+
+    if items:
+        semantic_cache_store(kind, embedding, items)
+        store_summary(cache_key, items)
+        return
+
+    fallback = await run_summary(kind, text)
+    store_summary(cache_key, fallback)
+    for item in fallback:
+        yield orjson.dumps(item) + b"\n"
+
+async def gemini_summarize_key_points(text: str):
+    """Google Gemini를 사용한 핵심요약"""
+    try:
+        model = genai.GenerativeModel(GEMINI_MODEL)
+        
+        prompt = build_key_points_prompt(text)
         
-        response = model.generate_content(
+        response = await model.generate_content_async(
             prompt,
             generation_config=genai.types.GenerationConfig(
                 temperature=0.3,
@@ -109,7 +544,7 @@ async def gemini_summarize_key_points(text: str):
         elif result_text.startswith('```'):
             result_text = result_text.split('```')[1].split('```')[0].strip()
         
-        return json.loads(result_text)
+        return orjson.loads(result_text)
     except Exception as e:
         print(f"Gemini 핵심요약 오류: {e}")
         return None
@@ -138,7 +573,7 @@ async def gemini_summarize_curator(text: str):
 }}
 """
         
-        response = model.generate_content(
+        response = await model.generate_content_async(
             prompt,
             generation_config=genai.types.GenerationConfig(
                 temperature=0.4,
@@ -153,7 +588,7 @@ async def gemini_summarize_curator(text: str):
         elif result_text.startswith('```'):
             result_text = result_text.split('```')[1].split('```')[0].strip()
         
-        return json.loads(result_text)
+        return orjson.loads(result_text)
     except Exception as e:
         print(f"Gemini 큐레이터 요약 오류: {e}")
         return None
@@ -163,35 +598,9 @@ async def gemini_summarize_timeline(text: str):
     try:
         model = genai.GenerativeModel(GEMINI_MODEL)
         
-        prompt = f"""
-당신은 전문 영상 편집자이자 요약 전문가입니다. 주어진 유튜브 스크립트를 시간 흐름에 따라 구간별로 나누어 타임라인 형태로 정리해주세요.
-
-지시사항:
-1. 내용의 흐름에 따라 4-8개의 구간으로 나누세요
-2. 각 구간에 대해 다음 정보를 제공하세요:
-   - timestamp: "X-Y분" 형태의 시간대
-   - subtitle: 해당 구간의 핵심 주제 (간결한 제목)
-   - summary: 구간 내용의 상세 요약 (2-3문장)
-   - keywords: 핵심 키워드 3-5개
-   - oneline_summary: 구어체로 한 문장 정리
-
-텍스트:
-{text}
-
-응답을 JSON 배열 형태로만 제공해주세요:
-[
-  {{
-    "timestamp": "0-3분",
-    "subtitle": "구간 제목",
-    "summary": "구간 내용 요약",
-    "keywords": ["키워드1", "키워드2", "키워드3"],
-    "oneline_summary": "구어체로 한 줄 정리"
-  }},
-  ...
-]
-"""
+        prompt = build_timeline_prompt(text)
         
-        response = model.generate_content(
+        response = await model.generate_content_async(
             prompt,
             generation_config=genai.types.GenerationConfig(
                 temperature=0.5,
@@ -206,7 +615,7 @@ async def gemini_summarize_timeline(text: str):
         elif result_text.startswith('```'):
             result_text = result_text.split('```')[1].split('```')[0].strip()
         
-        return json.loads(result_text)
+        return orjson.loads(result_text)
     except Exception as e:
         print(f"Gemini 타임라인 요약 오류: {e}")
         return None
@@ -215,34 +624,135 @@ async def gemini_summarize_timeline(text: str):
 class SummarizationRequest(BaseModel):
     text: str
 
+
+# 요약 입력 길이 제한: 너무 짧으면 모델 호출 없이 빈 결과, 너무 길면 413 (Gemini 토큰 폭증 방지)
+MIN_SUMMARY_TEXT_LENGTH = 30
+MAX_SUMMARY_TEXT_LENGTH = int(os.getenv("MAX_SUMMARY_TEXT_LENGTH", "200000"))
+EMPTY_SUMMARIES = {
+    "key_summary": [],
+    "curator": {"title": "", "one_line_summary": "", "key_points": []},
+    "timeline_summary": [],
+}
+
+
+def check_summary_text(text: str) -> bool:
+    """요약할 필요가 없을 만큼 짧으면 True, 너무 길면 413 오류"""
+    if len(text) > MAX_SUMMARY_TEXT_LENGTH:
+        raise HTTPException(status_code=413,
+                            detail=f"텍스트가 너무 깁니다 (최대 {MAX_SUMMARY_TEXT_LENGTH:,}자)")
+    return len(text.strip()) < MIN_SUMMARY_TEXT_LENGTH
+
+def summary_pool_context():
+    """요약 워커 시작 방식: POSIX는 forkserver (torch/transformers를 한 번만 import한 서버에서 fork),
+    Windows는 spawn (CUDA를 초기화한 부모를 그대로 fork하지 않음)"""
+    if os.name == "nt":
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["text_summarizer"])
+    return context
+
+
+# --- Lifecycle ---
+@app.on_event("startup")
+async def load_models():
+    """요약 모델 로드 (import 시점이 아닌 서버 시작 시 한 번만)"""
+    global summary_pool
+    if SUMMARIZER_PROCESSES > 0:
+        if summary_pool is None:
+            summary_pool = ProcessPoolExecutor(max_workers=SUMMARIZER_PROCESSES,
+                                               mp_context=summary_pool_context(),
+                                               initializer=text_summarizer.init_worker)
+            print(f"⚙️  요약 프로세스 풀 사용 (워커 {SUMMARIZER_PROCESSES}개)")
+    else:
+        await asyncio.to_thread(text_summarizer.load_summarizer)
+
+
+@app.on_event("startup")
+async def load_semantic_cache_model():
+    """Gemini 의미 캐시용 임베딩 모델 로드 (SEMANTIC_CACHE_MODEL 설정 시)"""
+    global semantic_encoder
+    if not (SEMANTIC_CACHE_MODEL and USE_GEMINI_SUMMARY and GEMINI_API_KEY):
+        return
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        print("⚠️  sentence-transformers가 설치되지 않아 의미 캐시를 사용하지 않습니다.")
+        return
+    semantic_encoder = await asyncio.to_thread(SentenceTransformer, SEMANTIC_CACHE_MODEL)
+    print(f"🧠 Gemini 의미 캐시 사용: {SEMANTIC_CACHE_MODEL} (임계값 {SEMANTIC_CACHE_THRESHOLD})")
+
+
+@app.on_event("startup")
+async def prewarm_whisper():
+    """기본 Whisper 모델을 백그라운드에서 미리 로드 (첫 변환 요청의 모델 로드 지연 제거)"""
+    if WHISPER_PREWARM_MODEL:
+        task = app.state.whisper_prewarm_task = asyncio.create_task(get_or_load_transcriber(WHISPER_PREWARM_MODEL))
+        task.add_done_callback(log_prewarm_result)
+
+
+def log_prewarm_result(task: asyncio.Task):
+    """prewarm 실패를 로그로 남김 (첫 요청 때 다시 로드를 시도함)"""
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        print(f"⚠️  Whisper {WHISPER_PREWARM_MODEL} 모델 미리 로드 실패: {error}")
+
+
+@app.on_event("startup")
+async def start_job_gc():
+    """메모리 작업 저장소 정리 태스크 시작"""
+    if redis_client is None:
+        app.state.job_gc_task = asyncio.create_task(gc_jobs())
+
+
+@app.on_event("shutdown")
+async def stop_summary_pool():
+    """요약 프로세스 풀 / yt-dlp 스레드 풀 종료"""
+    if summary_pool is not None:
+        summary_pool.shutdown(wait=False, cancel_futures=True)
+    EXTRACT_POOL.shutdown(wait=False, cancel_futures=True)
+
+
 # --- HTML Routes ---
+@lru_cache(maxsize=1)
+def render_home() -> tuple:
+    """메인 페이지를 한 번만 렌더링하여 (bytes, ETag)로 보관"""
+    body = templates.get_template("dashboard.html").render().encode("utf-8")
+    return body, '"' + hashlib.md5(body).hexdigest() + '"'
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """메인 페이지 - 개선된 접근성과 모듈화된 컴포넌트"""
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    body, etag = render_home()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
 
 # --- API Routes ---
 @app.post("/transcribe")
 async def transcribe(
     background_tasks: BackgroundTasks,
-    url: str = Form(...),
-    format: str = Form("mp3"),
+    url: str = Form(..., max_length=2048),
+    format: str = Form("pcm"),
     method: str = Form("whisper"), 
     model: str = Form("base")
 ):
     """음성 변환 작업 시작"""
-    if 'youtube.com' not in url and 'youtu.be' not in url:
+    if not parse_youtube_video_id(url):
         raise HTTPException(status_code=400, detail="유효한 YouTube URL을 입력해주세요")
     
     job_id = str(uuid.uuid4())
-    jobs[job_id] = {
+    await save_job(job_id, {
         'status': '비디오 정보 확인 중...', 
         'completed': False,
         'success': False,
         'result': None,
         'error': None,
-        'created_at': datetime.now()
-    }
+        'created_at': datetime.now().isoformat()
+    })
     
     background_tasks.add_task(process_transcription, job_id, url, format, method, model)
     return {"job_id": job_id}
@@ -251,83 +761,71 @@ async def transcribe(
 @app.get("/status/{job_id}")
 async def get_status(job_id: str):
     """작업 상태 확인"""
-    if job_id not in jobs:
+    job = await get_job(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
-    return jobs[job_id]
+    return job
+
+
+@app.get("/status_stream/{job_id}")
+async def stream_status(job_id: str):
+    """작업 상태 스트림 (Server-Sent Events)"""
+    if await get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return StreamingResponse(job_status_events(job_id),
+                             media_type="text/event-stream",
+                             headers=LIVE_STREAM_HEADERS)
+
+
+@app.get("/audio/{video_id}/{audio_format}")
+async def download_audio(video_id: str, audio_format: str):
+    """캐시된 오디오 파일 다운로드"""
+    audio_path = AUDIO_CACHE.get((video_id, audio_format))
+    if not audio_path or not os.path.exists(audio_path):
+        raise HTTPException(status_code=404, detail="오디오 파일을 찾을 수 없습니다")
+    return FileResponse(audio_path, filename=os.path.basename(audio_path))
 
 @app.post("/summarize/key_summary")
-async def summarize_key_points(payload: SummarizationRequest):
+async def summarize_key_points(payload: SummarizationRequest, stream: bool = False):
     """
     핵심요약 API - OpenAI 우선, T5 백업
+    stream=true 이면 문단 요약을 완성되는 대로 NDJSON으로 전송
     """
+    if check_summary_text(payload.text):
+        empty = EMPTY_SUMMARIES["key_summary"]
+        return ndjson_response(empty) if stream else ORJSONResponse(content=empty)
+    cache_key = summary_cache_key("key_summary", payload.text)
+    cached = get_cached_summary(cache_key)
+    if cached is not None:
+        return ndjson_response(cached) if stream else ORJSONResponse(content=cached)
+
     # Google Gemini API 사용 (우선순위)
     if USE_GEMINI_SUMMARY and GEMINI_API_KEY:
         try:
+            embedding, similar = await semantic_cache_lookup("key_summary", payload.text)
+            if similar is not None:
+                store_summary(cache_key, similar)
+                return ndjson_response(similar) if stream else ORJSONResponse(content=similar)
+            if stream:
+                return StreamingResponse(
+                    stream_gemini_summary("key_summary", cache_key, embedding, payload.text,
+                                          build_key_points_prompt(payload.text), 0.3, 2000),
+                    media_type="application/x-ndjson",
+                    headers=LIVE_STREAM_HEADERS)
             result = await gemini_summarize_key_points(payload.text)
             if result:
-                return JSONResponse(content=result)
+                semantic_cache_store("key_summary", embedding, result)
+                return cache_summary(cache_key, result)
         except Exception as e:
             print(f"Gemini 핵심요약 실패, T5로 백업: {e}")
     
-    # T5 모델 백업
-    if not summarizer:
-        # Use simple rule-based summarization if model is not available
-        try:
-            # Split by double newlines first, then by single newlines if no double newlines
-            paragraphs = payload.text.split('\n\n')
-            if len(paragraphs) == 1:
-                paragraphs = [p.strip() for p in payload.text.split('\n') if p.strip() and len(p.strip()) > 10]
-            else:
-                paragraphs = [p.strip() for p in paragraphs if p.strip()]
-            
-            summaries = []
-            for para in paragraphs:
-                if len(para.strip()) < 30:  # 너무 짧은 문단은 그냥 사용
-                    summary_text = para.strip()
-                else:
-                    # Simple extractive summarization: take first and most important sentences
-                    sentences = [s.strip() for s in para.split('.') if s.strip()]
-                    if len(sentences) <= 2:
-                        summary_text = para.strip()
-                    else:
-                        # Take first sentence and longest sentence (likely contains key info)
-                        first_sentence = sentences[0] + '.'
-                        longest_sentence = max(sentences[1:], key=len, default='') + ('.' if sentences[1:] else '')
-                        summary_text = first_sentence + (f' {longest_sentence}' if longest_sentence and longest_sentence != '.' else '')
-                
-                if summary_text and len(summary_text.strip()) > 5:
-                    summaries.append({"paragraph_summary": summary_text.strip()})
-            
-            return JSONResponse(content=summaries)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"요약 처리 중 오류 발생: {str(e)}")
-
+    # T5 모델 백업 (모델이 없으면 규칙 기반 요약)
     try:
-        # Split by double newlines first, then by single newlines if needed
-        paragraphs = payload.text.split('\n\n')
-        if len(paragraphs) == 1:
-            paragraphs = [p.strip() for p in payload.text.split('\n') if p.strip() and len(p.strip()) > 10]
-        else:
-            paragraphs = [p.strip() for p in paragraphs if p.strip()]
-            
-        summaries = []
-        for para in paragraphs:
-            if len(para) < 50:  # 너무 짧은 문단은 그냥 사용
-                summary_text = para
-            else:
-                # 텍스트 길이 제한 (T5 모델 안정성)
-                para_truncated = para[:800] if len(para) > 800 else para
-                summary = summarizer(para_truncated, 
-                                   max_length=120, 
-                                   min_length=25, 
-                                   do_sample=False,
-                                   truncation=True)
-                summary_text = summary[0]['summary_text']
-            
-            if summary_text and len(summary_text.strip()) > 5:
-                summaries.append({"paragraph_summary": summary_text.strip()})
-                
-        return JSONResponse(content=summaries)
+        summaries = await run_summary("key_summary", payload.text)
+        if stream:
+            store_summary(cache_key, summaries)
+            return ndjson_response(summaries)
+        return cache_summary(cache_key, summaries)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"요약 처리 중 오류 발생: {str(e)}")
 
@@ -337,211 +835,75 @@ async def summarize_curator(payload: SummarizationRequest):
     """
     큐레이터 요약 API - OpenAI 우선, T5 백업
     """
+    if check_summary_text(payload.text):
+        return ORJSONResponse(content=EMPTY_SUMMARIES["curator"])
+    cache_key = summary_cache_key("curator", payload.text)
+    cached = get_cached_summary(cache_key)
+    if cached is not None:
+        return ORJSONResponse(content=cached)
+
     # Google Gemini API 사용 (우선순위)
     if USE_GEMINI_SUMMARY and GEMINI_API_KEY:
         try:
+            embedding, similar = await semantic_cache_lookup("curator", payload.text)
+            if similar is not None:
+                return cache_summary(cache_key, similar)
             result = await gemini_summarize_curator(payload.text)
             if result:
-                return JSONResponse(content=result)
+                semantic_cache_store("curator", embedding, result)
+                return cache_summary(cache_key, result)
         except Exception as e:
             print(f"Gemini 큐레이터 요약 실패, T5로 백업: {e}")
     
-    # T5 모델 백업
-    if not summarizer:
-        # Use simple rule-based approach if model is not available
-        try:
-            text = payload.text.strip()
-            sentences = [s.strip() for s in text.split('.') if s.strip() and len(s.strip()) > 10]
-            
-            # Generate title from first meaningful sentence or first few words
-            if sentences:
-                title_candidate = sentences[0]
-                if len(title_candidate) > 100:
-                    # Take first part if too long
-                    words = title_candidate.split()[:10]
-                    title = ' '.join(words) + ('...' if len(words) == 10 else '')
-                else:
-                    title = title_candidate
-            else:
-                title = "YouTube 영상 요약"
-            
-            # Generate one line summary from longest sentences
-            if len(sentences) >= 2:
-                summary_candidates = sorted(sentences[:5], key=len, reverse=True)[:2]
-                one_line_summary = '. '.join(summary_candidates) + '.'
-            else:
-                one_line_summary = sentences[0] if sentences else "영상 내용 요약"
-            
-            # Extract key points from longest/most informative sentences
-            if len(sentences) >= 3:
-                key_point_candidates = sorted(sentences, key=len, reverse=True)[:3]
-                key_points = [point + ('.' if not point.endswith('.') else '') for point in key_point_candidates]
-            else:
-                key_points = [s + ('.' if not s.endswith('.') else '') for s in sentences[:3]]
-                
-            # Ensure we have at least something
-            if not key_points:
-                key_points = ["영상의 주요 내용을 다룹니다."]
-
-            curated_summary = {
-                "title": title,
-                "one_line_summary": one_line_summary,
-                "key_points": key_points
-            }
-            return JSONResponse(content=curated_summary)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"큐레이션 처리 중 오류 발생: {str(e)}")
-
+    # T5 모델 백업 (모델이 없으면 규칙 기반 요약)
     try:
-        # T5 모델 안정성을 위한 텍스트 제한
-        text_truncated = payload.text[:1000] if len(payload.text) > 1000 else payload.text
-        full_summary = summarizer(text_truncated, 
-                                max_length=200, 
-                                min_length=50, 
-                                do_sample=False,
-                                truncation=True)[0]['summary_text']
-        
-        # 제목 생성
-        title_text = payload.text[:500]
-        title = summarizer(title_text, 
-                          max_length=60, 
-                          min_length=15, 
-                          do_sample=False,
-                          truncation=True)[0]['summary_text']
-
-        # 핵심 포인트 추출 - 개선된 방법
-        sentences = [s.strip() for s in payload.text.split('.') if s.strip() and len(s.strip()) > 20]
-        
-        # Get meaningful sentences for key points
-        if len(sentences) >= 3:
-            # Sort by length and take diverse content
-            key_point_candidates = sorted(sentences, key=len, reverse=True)[:6]
-            # Select 3 most diverse points
-            key_points = []
-            for candidate in key_point_candidates:
-                if len(key_points) >= 3:
-                    break
-                # Avoid very similar points
-                is_similar = False
-                for existing in key_points:
-                    if len(set(candidate.split()) & set(existing.split())) > len(candidate.split()) * 0.5:
-                        is_similar = True
-                        break
-                if not is_similar:
-                    key_points.append(candidate + ('.' if not candidate.endswith('.') else ''))
-        else:
-            key_points = [s + ('.' if not s.endswith('.') else '') for s in sentences[:3]]
-            
-        # Ensure we have at least something
-        if not key_points:
-            key_points = ["영상의 주요 내용을 다룹니다."]
-
-        curated_summary = {
-            "title": title,
-            "one_line_summary": full_summary,
-            "key_points": key_points
-        }
-        return JSONResponse(content=curated_summary)
+        curated_summary = await run_summary("curator", payload.text)
+        return cache_summary(cache_key, curated_summary)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"큐레이션 처리 중 오류 발생: {str(e)}")
 
 
 @app.post("/summarize/timeline_summary")
-async def summarize_timeline(payload: SummarizationRequest):
+async def summarize_timeline(payload: SummarizationRequest, stream: bool = False):
     """
     타임라인 요약 API - OpenAI 우선, Rule-based 백업
+    stream=true 이면 구간 요약을 완성되는 대로 NDJSON으로 전송
     """
+    if check_summary_text(payload.text):
+        empty = EMPTY_SUMMARIES["timeline_summary"]
+        return ndjson_response(empty) if stream else ORJSONResponse(content=empty)
+    cache_key = summary_cache_key("timeline_summary", payload.text)
+    cached = get_cached_summary(cache_key)
+    if cached is not None:
+        return ndjson_response(cached) if stream else ORJSONResponse(content=cached)
+
     # Google Gemini API 사용 (우선순위)
     if USE_GEMINI_SUMMARY and GEMINI_API_KEY:
         try:
+            embedding, similar = await semantic_cache_lookup("timeline_summary", payload.text)
+            if similar is not None:
+                store_summary(cache_key, similar)
+                return ndjson_response(similar) if stream else ORJSONResponse(content=similar)
+            if stream:
+                return StreamingResponse(
+                    stream_gemini_summary("timeline_summary", cache_key, embedding, payload.text,
+                                          build_timeline_prompt(payload.text), 0.5, 2500),
+                    media_type="application/x-ndjson",
+                    headers=LIVE_STREAM_HEADERS)
             result = await gemini_summarize_timeline(payload.text)
             if result:
-                return JSONResponse(content=result)
+                semantic_cache_store("timeline_summary", embedding, result)
+                return cache_summary(cache_key, result)
         except Exception as e:
             print(f"Gemini 타임라인 요약 실패, Rule-based로 백업: {e}")
     
     # Rule-based 백업
     try:
-        text = payload.text.strip()
-        if not text or len(text) < 20:
-            return JSONResponse(content=[])
-        
-        # 텍스트를 문단으로 분할 (더 긴 문단으로)
-        paragraphs = []
-        sentences = [s.strip() for s in text.split('.') if s.strip() and len(s.strip()) > 15]
-        
-        # 문장들을 그룹화하여 단락 생성 (약 3-5 문장씩)
-        current_paragraph = []
-        for sentence in sentences:
-            current_paragraph.append(sentence)
-            # 문단 길이가 적당하거나 키워드 변화가 감지되면 새 문단 시작
-            if len(current_paragraph) >= 4 or len(' '.join(current_paragraph)) > 300:
-                paragraphs.append('. '.join(current_paragraph) + '.')
-                current_paragraph = []
-        
-        # 남은 문장들 추가
-        if current_paragraph:
-            paragraphs.append('. '.join(current_paragraph) + '.')
-        
-        timeline_sections = []
-        
-        for i, paragraph in enumerate(paragraphs):
-            if len(paragraph.strip()) < 20:  # 너무 짧은 문단 제외
-                continue
-                
-            # 타임스탬프 생성 (대략적으로)
-            timestamp = f"{(i * 3) + 1}-{(i + 1) * 3}분"
-            
-            # 소타이틀 생성 (첫 번째 문장의 핵심 추출)
-            first_sentence = paragraph.split('.')[0].strip()
-            if len(first_sentence) > 60:
-                words = first_sentence.split()[:8]
-                subtitle = ' '.join(words) + '...'
-            else:
-                subtitle = first_sentence
-            
-            # 단락 요약 (핵심 문장들 선별)
-            sentences_in_paragraph = [s.strip() for s in paragraph.split('.') if s.strip()]
-            if len(sentences_in_paragraph) > 1:
-                # 가장 긴 2-3개 문장을 핵심으로 선택
-                important_sentences = sorted(sentences_in_paragraph[:4], key=len, reverse=True)[:2]
-                summary = '. '.join(important_sentences) + '.'
-            else:
-                summary = paragraph
-            
-            # 키워드 추출 (간단한 방식으로)
-            words = paragraph.lower().split()
-            # 일반적인 불용어 제거 후 빈도 높은 단어들을 키워드로
-            stop_words = {'을', '를', '이', '가', '은', '는', '의', '에', '에서', '으로', '와', '과', '하고', '그리고', '또한', '하지만', '그런데', '그래서', '따라서', '즉', '것', '수', '때', '곳', '등'}
-            meaningful_words = [w for w in words if len(w) > 1 and w not in stop_words]
-            word_freq = {}
-            for word in meaningful_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-            
-            # 빈도수 기준 상위 3-5개 키워드 선택
-            keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:4]
-            keyword_list = [kw[0] for kw in keywords if kw[1] > 1]
-            
-            # 한마디 정리 (구어체로)
-            if len(sentences_in_paragraph) > 0:
-                key_sentence = sentences_in_paragraph[0]
-                if "합니다" in key_sentence or "습니다" in key_sentence:
-                    oneline = key_sentence.replace("합니다", "해요").replace("습니다", "예요")
-                else:
-                    oneline = key_sentence + "라는 얘기에요"
-            else:
-                oneline = "핵심 내용이에요"
-            
-            timeline_sections.append({
-                "timestamp": timestamp,
-                "subtitle": subtitle,
-                "summary": summary,
-                "keywords": keyword_list,
-                "oneline_summary": oneline
-            })
-        
-        return JSONResponse(content=timeline_sections[:8])  # 최대 8개 섹션으로 제한
-        
+        timeline_sections = await run_summary("timeline_summary", payload.text)
+        if stream:
+            store_summary(cache_key, timeline_sections)
+            return ndjson_response(timeline_sections)
+        return cache_summary(cache_key, timeline_sections)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"타임라인 요약 처리 중 오류 발생: {str(e)}")
 
@@ -550,39 +912,47 @@ async def summarize_timeline(payload: SummarizationRequest):
 async def process_transcription(job_id: str, url: str, format: str, method: str, model: str):
     """백그라운드 음성 변환 처리"""
     try:
-        jobs[job_id]['status'] = '비디오 정보 확인 중...'
-        video_info = extractor.get_video_info(url)
+        await update_job(job_id, status='비디오 정보 확인 중...')
+        video_info = await run_extract(extractor.get_video_info, url)
         if not video_info:
             raise Exception('비디오 정보를 가져올 수 없습니다')
 
-        jobs[job_id]['status'] = f'오디오 추출 중... ({format})'
-        audio_path = extractor.extract_audio(url, format)
+        await update_job(job_id, status=f'오디오 추출 중... ({format})')
+        audio_path = await extract_audio_cached(url, format, video_info)
         if not audio_path:
             raise Exception('오디오 추출에 실패했습니다')
 
-        jobs[job_id]['status'] = f'음성 인식 중... ({method})'
-        transcriber_instance = SpeechTranscriber(model_name=model)
-        result = transcriber_instance.transcribe(audio_path, method=method)
-        
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+        # 변환이 끝날 때까지 캐시에서 밀려나도 파일이 삭제되지 않도록 사용 중으로 표시
+        AUDIO_IN_USE[audio_path] += 1
+        try:
+            await update_job(job_id, status=f'음성 인식 중... ({method})')
+            transcriber_instance = await get_or_load_transcriber(model)
+            # ffmpeg 디코딩은 세마포어 밖에서 - 다른 요청이 모델을 쓰는 동안 다음 오디오를 준비
+            pcm = await asyncio.to_thread(transcriber_instance.prepare_audio, audio_path, method)
+            async with WHISPER_SEM:
+                result = await asyncio.to_thread(transcriber_instance.transcribe, audio_path, method=method, pcm=pcm,
+                                                 google_language=GOOGLE_LANGUAGE_HINTS.get(model, 'ko-KR'))
+            pcm = None  # 디코딩된 PCM(1시간 ≈ 115MB)은 작업이 끝날 때까지 들고 있지 않음
+            remember_google_language(model, method, result)
+        finally:
+            # 캐시된 오디오 파일은 재사용을 위해 유지
+            AUDIO_IN_USE[audio_path] -= 1
+            discard_audio_if_unused(audio_path)
         
         if result.get('success', False):
-            jobs[job_id].update({
-                'status': '변환 완료!',
-                'completed': True,
-                'success': True,
-                'result': result
-            })
+            await update_job(job_id,
+                             status='변환 완료!',
+                             completed=True,
+                             success=True,
+                             result=result)
         else:
             raise Exception(result.get('error', '알 수 없는 오류'))
             
     except Exception as e:
-        jobs[job_id].update({
-            'completed': True,
-            'success': False,
-            'error': str(e)
-        })
+        await update_job(job_id,
+                         completed=True,
+                         success=False,
+                         error=str(e))
 
 # --- Main Execution ---
 if __name__ == "__main__":
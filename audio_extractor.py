@@ -2,132 +2,171 @@
 YouTube 오디오 추출 모듈
 """
 import os
+import re
+import shutil
+import threading
+import time
 import yt_dlp
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 
+# YouTube URL 검증 + 비디오 ID 추출 (호스트부터 고정된 패턴이라 잘못된 입력은 바로 실패)
+YOUTUBE_URL_RE = re.compile(
+    r"^(?:https?://)?(?:www\.|m\.|music\.)?"
+    r"(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|live/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?:[?&#/].*)?$"
+)
+
+
+def parse_youtube_video_id(url: str) -> Optional[str]:
+    """유효한 YouTube URL이면 비디오 ID 반환, 아니면 None"""
+    match = YOUTUBE_URL_RE.match(url.strip())
+    return match.group(1) if match else None
+
+
+# 파일명 정리용 패턴
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s\-가-힣]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Whisper 입력용 포맷: 16kHz 모노 PCM WAV (mp3 인코딩 후 다시 디코딩하는 과정을 생략)
+WHISPER_PCM_FORMAT = "pcm"
+WHISPER_PCM_ARGS = ['-ar', '16000', '-ac', '1']
+
+# 다운로드 병렬화: DASH/HLS 조각 동시 다운로드 + aria2c가 있으면 다중 연결 사용
+CONCURRENT_FRAGMENTS = int(os.getenv("YTDLP_CONCURRENT_FRAGMENTS", "8"))
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+ARIA2C_PATH = shutil.which("aria2c")
+
+# extract_info 결과 캐시 (비디오 ID 기준, 같은 영상 메타데이터를 다시 요청하지 않음)
+VIDEO_INFO_CACHE_SIZE = 512
+VIDEO_INFO_TTL_SECONDS = 3600
+
+
 class YouTubeAudioExtractor:
     def __init__(self, output_dir: str = "downloads"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._info_cache: "OrderedDict[str, tuple]" = OrderedDict()  # 비디오 ID -> (저장 시각, info)
+        self._info_cache_lock = threading.Lock()  # 여러 스레드에서 호출됨
     
-    def extract_audio(self, url: str, format: str = "mp3") -> Optional[str]:
+    def extract_audio(self, url: str, format: str = "mp3", info: Optional[dict] = None) -> Optional[str]:
         """
         YouTube URL에서 오디오 추출
         
         Args:
             url: YouTube URL
-            format: 출력 포맷 (mp3, wav)
+            format: 출력 포맷 (pcm: 16kHz 모노 WAV, mp3, wav)
+            info: 이미 가져온 비디오 정보 (있으면 메타데이터를 다시 요청하지 않음)
             
         Returns:
             추출된 오디오 파일 경로
         """
-        downloaded_file_path = None
-        
-        def progress_hook(d):
-            nonlocal downloaded_file_path
-            if d['status'] == 'finished':
-                downloaded_file_path = d['filename']
+        expected_path = None
         
         try:
             # 비디오 제목 가져오기
-            info = self._get_video_info_safe(url)
+            if not info:
+                info = self._get_video_info_safe(url)
             if not info:
                 return None
                 
             title = info.get('title', 'Unknown')
             # 안전한 파일명 생성
             safe_title = self._sanitize_filename(title)
+            # 후처리(FFmpegExtractAudio)가 끝난 최종 파일 경로 - 폴더를 추측해서 찾지 않음
+            expected_path = self._expected_audio_path(format, safe_title, parse_youtube_video_id(url) or info.get('id'))
+            outtmpl = str(expected_path.with_suffix('.%(ext)s'))
             
             # yt-dlp 옵션 설정
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': str(self.output_dir / f'{safe_title}.%(ext)s'),
-                'postprocessors': [{
+            if format == WHISPER_PCM_FORMAT:
+                postprocessor = {'key': 'FFmpegExtractAudio', 'preferredcodec': 'wav'}
+            else:
+                postprocessor = {
                     'key': 'FFmpegExtractAudio',
                     'preferredcodec': format,
                     'preferredquality': '192',
-                }],
+                }
+            ydl_opts = {
+                'format': 'bestaudio/best',
+                'outtmpl': outtmpl,
+                'postprocessors': [postprocessor],
                 'noplaylist': True,
-                'progress_hooks': [progress_hook],
+                'concurrent_fragment_downloads': CONCURRENT_FRAGMENTS,
+                'http_chunk_size': HTTP_CHUNK_SIZE,
             }
+            if ARIA2C_PATH:
+                ydl_opts['external_downloader'] = {'default': ARIA2C_PATH}
+                ydl_opts['external_downloader_args'] = {'aria2c': ['-x', '16', '-k', '1M']}
+            if format == WHISPER_PCM_FORMAT:
+                ydl_opts['postprocessor_args'] = {'extractaudio': WHISPER_PCM_ARGS}
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
-                
-                # 후크에서 파일 경로를 받았으면 반환
-                if downloaded_file_path and os.path.exists(downloaded_file_path):
-                    return downloaded_file_path
-                
-                # 후크가 실패한 경우 폴더에서 찾기
-                return self._find_latest_audio_file(format, safe_title)
+            return str(expected_path) if expected_path.exists() else None
                 
         except Exception as e:
             print(f"오디오 추출 실패: {e}")
-            # 오류가 발생해도 파일이 다운로드되었을 수 있으므로 확인
-            try:
-                return self._find_latest_audio_file(format)
-            except:
-                return None
+            # 오류가 발생해도 최종 파일이 만들어졌을 수 있으므로 확인
+            if expected_path is not None and expected_path.exists():
+                return str(expected_path)
+            return None
     
     def _get_video_info_safe(self, url: str) -> dict:
-        """안전하게 비디오 정보 가져오기"""
+        """안전하게 비디오 정보 가져오기 (비디오 ID 기준 TTL 캐시)"""
+        video_id = parse_youtube_video_id(url)
+        if video_id:
+            with self._info_cache_lock:
+                cached = self._info_cache.get(video_id)
+                if cached and time.monotonic() - cached[0] < VIDEO_INFO_TTL_SECONDS:
+                    self._info_cache.move_to_end(video_id)
+                    return cached[1]
         try:
             ydl_opts = {'quiet': True}
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.extract_info(url, download=False)
+                info = ydl.extract_info(url, download=False)
         except Exception as e:
             print(f"비디오 정보 가져오기 실패: {e}")
             return {}
+        if video_id and info:
+            with self._info_cache_lock:
+                self._info_cache[video_id] = (time.monotonic(), info)
+                self._info_cache.move_to_end(video_id)
+                while len(self._info_cache) > VIDEO_INFO_CACHE_SIZE:
+                    self._info_cache.popitem(last=False)
+        return info
     
     def _sanitize_filename(self, filename: str) -> str:
         """파일명에서 특수문자 제거"""
-        import re
         # 한글, 영문, 숫자, 공백, 하이픈, 언더스코어만 허용
-        safe_name = re.sub(r'[^\w\s\-가-힣]', '', filename)
+        safe_name = _UNSAFE_FILENAME_RE.sub('', filename)
         # 연속된 공백을 하나로 줄이고 양끝 공백 제거
-        safe_name = re.sub(r'\s+', ' ', safe_name).strip()
+        safe_name = _WHITESPACE_RE.sub(' ', safe_name).strip()
         # 길이 제한 (200자)
         if len(safe_name) > 200:
             safe_name = safe_name[:200]
         return safe_name or "audio"
     
-    def _find_latest_audio_file(self, preferred_format: str, title_hint: str = None) -> Optional[str]:
-        """다운로드 폴더에서 최신 오디오 파일 찾기"""
-        try:
-            audio_extensions = ['.mp3', '.wav', '.m4a', '.ogg', '.flac']
-            audio_files = []
-            
-            for file_path in self.output_dir.iterdir():
-                if file_path.suffix.lower() in audio_extensions:
-                    # 제목 힌트가 있으면 우선 매칭
-                    if title_hint and title_hint.lower() in file_path.stem.lower():
-                        return str(file_path)
-                    audio_files.append((file_path.stat().st_mtime, file_path))
-            
-            if audio_files:
-                # 가장 최근 파일 반환
-                latest_file = max(audio_files, key=lambda x: x[0])[1]
-                return str(latest_file)
-            
-            return None
-        except Exception as e:
-            print(f"오디오 파일 검색 실패: {e}")
-            return None
+    def _expected_audio_path(self, format: str, safe_title: str, video_id: Optional[str] = None) -> Path:
+        """포맷별 최종 오디오 파일 경로 (pcm: {ID}.{제목}.16k.wav, 그 외: {ID}.{제목}.{format})
+
+        제목이 같거나 정리 후 비어 'audio'가 된 다른 영상과 파일이 겹치지 않도록 비디오 ID를 앞에 붙임
+        """
+        stem = f'{video_id}.{safe_title}' if video_id else safe_title
+        if format == WHISPER_PCM_FORMAT:
+            # 일반 wav 파일과 겹치지 않도록 파일명 구분
+            return self.output_dir / f'{stem}.16k.wav'
+        return self.output_dir / f'{stem}.{format}'
     
     def get_video_info(self, url: str) -> dict:
         """비디오 정보 가져오기"""
-        try:
-            ydl_opts = {'quiet': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0)
-                }
-        except Exception as e:
-            print(f"비디오 정보 가져오기 실패: {e}")
-            return {}
\ No newline at end of file
+        info = self._get_video_info_safe(url)
+        if not info:
+            return {}
+        return {
+            'title': info.get('title', 'Unknown'),
+            'duration': info.get('duration', 0),
+            'uploader': info.get('uploader', 'Unknown'),
+            'view_count': info.get('view_count', 0)
+        }
\ No newline at end of file
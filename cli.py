@@ -7,15 +7,15 @@ import sys
 import os
 from pathlib import Path
 import json
-from audio_extractor import YouTubeAudioExtractor
+from audio_extractor import YouTubeAudioExtractor, parse_youtube_video_id
 from speech_transcriber import SpeechTranscriber
 
 
 def main():
     parser = argparse.ArgumentParser(description='YouTube 오디오를 텍스트로 변환')
     parser.add_argument('url', help='YouTube URL')
-    parser.add_argument('-f', '--format', default='mp3', choices=['mp3', 'wav'], 
-                       help='오디오 포맷 (기본: mp3)')
+    parser.add_argument('-f', '--format', default='pcm', choices=['pcm', 'mp3', 'wav'], 
+                       help='오디오 포맷 (기본: pcm - 16kHz 모노 WAV, 음성 인식에 바로 사용)')
     parser.add_argument('-m', '--method', default='whisper', 
                        choices=['whisper', 'google', 'both'],
                        help='음성 인식 방법 (기본: whisper)')
@@ -31,7 +31,7 @@ def main():
     args = parser.parse_args()
     
     # YouTube URL 검증
-    if 'youtube.com' not in args.url and 'youtu.be' not in args.url:
+    if not parse_youtube_video_id(args.url):
         print("❌ 유효한 YouTube URL을 입력해주세요.")
         sys.exit(1)
     
@@ -85,7 +85,7 @@ def main():
         print(f"언어: {result['whisper'].get('language', 'Unknown')}")
         
         print("\n🌐 Google 결과:")
-        print(result['google'].get('text', '변환 실패'))
+        print(result['google'].get('text') or result['google'].get('error', '변환 실패'))
     else:
         print(f"\n{result.get('text', '변환 실패')}")
         if 'language' in result:
@@ -111,7 +111,7 @@ def main():
             f.write("Whisper 결과:\n")
             f.write(result['whisper'].get('text', '변환 실패') + "\n\n")
             f.write("Google 결과:\n")
-            f.write(result['google'].get('text', '변환 실패') + "\n")
+            f.write((result['google'].get('text') or result['google'].get('error', '변환 실패')) + "\n")
         else:
             f.write(result.get('text', '변환 실패'))
     
@@ -7,18 +7,35 @@ import subprocess
 import sys
 import os
 import platform
+import shutil
+import time
 from pathlib import Path
 
+# 실행 중에 바뀌지 않는 플랫폼 정보는 한 번만 확인
+_SYSTEM = platform.system().lower()
+IS_WINDOWS = _SYSTEM == "windows"
+IS_DARWIN = _SYSTEM == "darwin"
+IS_LINUX = _SYSTEM == "linux"
 
-def run_command(command, description):
-    """명령어 실행"""
+# 가상환경의 pip / python 경로
+PIP_PATH = "venv\\Scripts\\pip" if IS_WINDOWS else "venv/bin/pip"
+PYTHON_PATH = "venv\\Scripts\\python" if IS_WINDOWS else "venv/bin/python"
+
+
+def run_command(command, description, stream=False):
+    """명령어 실행 (문자열은 셸로, 리스트는 셸 없이 직접 실행)
+
+    stream=True 이면 출력을 버퍼에 모으지 않고 터미널로 바로 내보냄 (pip/apt 등 오래 걸리는 설치의 진행 상황 표시)
+    """
     print(f"\n🔧 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, shell=isinstance(command, str), check=True,
+                       capture_output=not stream, text=True)
         print(f"✅ {description} 완료")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ {description} 실패: {e.stderr}")
+        # 스트리밍 모드에서는 오류 출력이 이미 터미널에 표시됨
+        print(f"❌ {description} 실패: {e.stderr or f'종료 코드 {e.returncode}'}")
         return False
 
 
@@ -31,32 +48,40 @@ def check_python_version():
     print(f"✅ Python {version.major}.{version.minor}.{version.micro} 감지됨")
 
 
+def _apt_cache_fresh(max_age_seconds=86400):
+    """APT 패키지 목록이 하루 이내에 갱신되었는지 확인 (apt update 생략 여부)"""
+    lists_dir = "/var/lib/apt/lists"
+    return os.path.isdir(lists_dir) and time.time() - os.path.getmtime(lists_dir) < max_age_seconds
+
+
 def install_system_dependencies():
     """시스템 의존성 설치"""
-    system = platform.system().lower()
-    
-    if system == "darwin":  # macOS
+    if IS_DARWIN:  # macOS
         print("🍎 macOS 감지됨")
-        if not run_command("which brew", "Homebrew 확인"):
+        if shutil.which("brew") is None:
             print("❌ Homebrew가 설치되어 있지 않습니다.")
             print("https://brew.sh/ 에서 Homebrew를 먼저 설치해주세요.")
             return False
         
-        return run_command("brew install ffmpeg", "FFmpeg 설치 (Homebrew)")
+        return run_command(["brew", "install", "ffmpeg"], "FFmpeg 설치 (Homebrew)", stream=True)
         
-    elif system == "linux":
+    elif IS_LINUX:
         print("🐧 Linux 감지됨")
         # Ubuntu/Debian
-        if run_command("which apt", "APT 패키지 매니저 확인"):
-            return run_command("sudo apt update && sudo apt install -y ffmpeg", "FFmpeg 설치 (APT)")
+        if shutil.which("apt"):
+            if _apt_cache_fresh():
+                command = ["sudo", "apt-get", "install", "-y", "ffmpeg"]
+            else:
+                command = ["sudo", "sh", "-c", "apt-get update && apt-get install -y ffmpeg"]
+            return run_command(command, "FFmpeg 설치 (APT)", stream=True)
         # CentOS/RHEL
-        elif run_command("which yum", "YUM 패키지 매니저 확인"):
-            return run_command("sudo yum install -y ffmpeg", "FFmpeg 설치 (YUM)")
+        elif shutil.which("yum"):
+            return run_command(["sudo", "yum", "install", "-y", "ffmpeg"], "FFmpeg 설치 (YUM)", stream=True)
         else:
             print("⚠️ 지원되지 않는 Linux 배포판입니다. FFmpeg를 수동으로 설치해주세요.")
             return False
             
-    elif system == "windows":
+    elif IS_WINDOWS:
         print("🪟 Windows 감지됨")
         print("⚠️ Windows에서는 FFmpeg를 수동으로 설치해야 합니다.")
         print("1. https://ffmpeg.org/download.html 에서 FFmpeg 다운로드")
@@ -67,36 +92,71 @@ def install_system_dependencies():
     return False
 
 
-def create_virtual_environment():
-    """가상환경 생성"""
+def start_virtual_environment():
+    """가상환경 생성을 백그라운드 프로세스로 시작 (이미 있으면 None)"""
     if os.path.exists("venv"):
-        print("✅ 가상환경이 이미 존재합니다.")
-        return True
-    
-    return run_command(f"{sys.executable} -m venv venv", "가상환경 생성")
+        return None
+    return subprocess.Popen([sys.executable, "-m", "venv", "venv"],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def abort_virtual_environment(process):
+    """설치 중단 시 백그라운드 가상환경 생성을 종료하고 덜 만들어진 venv 디렉토리 삭제"""
+    if process is None:
+        return
+    if process.poll() is None:
+        process.terminate()
+    process.communicate()
+    shutil.rmtree("venv", ignore_errors=True)
+
+
+def create_virtual_environment(process=None):
+    """가상환경 생성 (start_virtual_environment로 시작한 프로세스가 있으면 완료 대기)"""
+    if process is None:
+        if os.path.exists("venv"):
+            print("✅ 가상환경이 이미 존재합니다.")
+            return True
+        return run_command([sys.executable, "-m", "venv", "venv"], "가상환경 생성")
+
+    print("\n🔧 가상환경 생성...")
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        print(f"❌ 가상환경 생성 실패: {stderr}")
+        return False
+    print("✅ 가상환경 생성 완료")
+    return True
 
 
 def install_python_dependencies():
     """Python 의존성 설치"""
-    # 가상환경의 pip 경로 결정
-    if platform.system().lower() == "windows":
-        pip_path = "venv\\Scripts\\pip"
-        python_path = "venv\\Scripts\\python"
-    else:
-        pip_path = "venv/bin/pip"
-        python_path = "venv/bin/python"
+    # uv가 있으면 병렬 다운로드/설치로 훨씬 빠르게 설치 (pip 업그레이드 불필요)
+    uv_path = shutil.which("uv")
+    if uv_path:
+        return run_command([uv_path, "pip", "install", "--python", PYTHON_PATH, "-r", "requirements.txt"],
+                           "Python 패키지 설치 (uv)", stream=True)
     
     # pip 업그레이드
-    if not run_command(f"{pip_path} install --upgrade pip", "pip 업그레이드"):
+    if not run_command(f"{PIP_PATH} install --upgrade pip", "pip 업그레이드", stream=True):
         return False
     
     # 의존성 설치
-    if not run_command(f"{pip_path} install -r requirements.txt", "Python 패키지 설치"):
+    if not run_command(f"{PIP_PATH} install -r requirements.txt", "Python 패키지 설치", stream=True):
         return False
     
     return True
 
 
+def _dir_entries(directory, listings):
+    """디렉토리의 항목 이름 집합 (listings에 캐시, 디렉토리가 없으면 빈 집합)"""
+    if directory not in listings:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            listings[directory] = set()
+    return listings[directory]
+
+
 def verify_project_structure():
     """프로젝트 구조 확인 및 생성"""
     print("\n📁 프로젝트 구조 확인 중...")
@@ -110,8 +170,13 @@ def verify_project_structure():
         "downloads"
     ]
     
+    # 디렉토리마다 scandir 한 번으로 이름 목록을 만들어 두고, 없는 항목만 생성
+    listings = {}
     for dir_path in required_dirs:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        path = Path(dir_path)
+        if path.name not in _dir_entries(path.parent, listings):
+            path.mkdir(parents=True, exist_ok=True)
+            listings.pop(path.parent, None)
         
     # 필수 파일 확인
     required_files = [
@@ -122,10 +187,10 @@ def verify_project_structure():
         "validate_build.py"
     ]
     
-    missing_files = []
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    missing_files = [
+        file_path for file_path in required_files
+        if Path(file_path).name not in _dir_entries(Path(file_path).parent, listings)
+    ]
             
     if missing_files:
         print(f"⚠️  누락된 파일들: {', '.join(missing_files)}")
@@ -140,27 +205,18 @@ def test_installation():
     """설치 테스트"""
     print("\n🧪 설치 테스트 중...")
     
-    # 가상환경의 python 경로
-    if platform.system().lower() == "windows":
-        python_path = "venv\\Scripts\\python"
-    else:
-        python_path = "venv/bin/python"
-    
-    # 기본 라이브러리 테스트
+    # 기본 라이브러리 테스트 (find_spec은 모듈을 실행하지 않아 torch 등 무거운 import를 피함)
     test_code = '''
-import yt_dlp
-import whisper
-import speech_recognition as sr
-from pydub import AudioSegment
-from fastapi import FastAPI
-from jinja2 import Environment
-import aiohttp
-from bs4 import BeautifulSoup
-print("✅ 모든 라이브러리 로드 성공!")
+import importlib.util, sys
+modules = ("yt_dlp", "faster_whisper", "speech_recognition", "fastapi", "jinja2", "aiohttp", "bs4")
+missing = [m for m in modules if importlib.util.find_spec(m) is None]
+if missing:
+    sys.exit("누락된 라이브러리: " + ", ".join(missing))
+print("✅ 모든 라이브러리 확인 완료!")
 '''
     
     try:
-        result = subprocess.run([python_path, "-c", test_code], 
+        result = subprocess.run([PYTHON_PATH, "-c", test_code], 
                               capture_output=True, text=True, check=True)
         print("✅ 라이브러리 테스트 성공!")
         
@@ -168,7 +224,7 @@ print("✅ 모든 라이브러리 로드 성공!")
         if Path("validate_build.py").exists():
             print("\n🔧 빌드 검증 실행 중...")
             try:
-                result = subprocess.run([python_path, "validate_build.py"], 
+                result = subprocess.run([PYTHON_PATH, "validate_build.py"], 
                                       capture_output=True, text=True, check=True)
                 print("✅ 빌드 검증 통과!")
                 return True
@@ -184,7 +240,7 @@ print("✅ 모든 라이브러리 로드 성공!")
 
 def show_usage_examples():
     """사용 예시 표시"""
-    python_cmd = "venv\\Scripts\\python" if platform.system().lower() == "windows" else "venv/bin/python"
+    python_cmd = PYTHON_PATH
     
     print("\n📖 사용 예시:")
     print("="*50)
@@ -230,15 +286,23 @@ def main():
     if not verify_project_structure():
         print("⚠️  일부 파일이 누락되었지만 기본 설치를 계속합니다.")
     
-    # 시스템 의존성 설치
-    if not install_system_dependencies():
-        print("❌ 시스템 의존성 설치 실패")
-        sys.exit(1)
+    # 가상환경 생성은 시스템 의존성 설치(네트워크)와 겹쳐서 백그라운드로 진행
+    venv_process = start_virtual_environment()
     
-    # 가상환경 생성
-    if not create_virtual_environment():
-        print("❌ 가상환경 생성 실패")
-        sys.exit(1)
+    try:
+        # 시스템 의존성 설치
+        if not install_system_dependencies():
+            print("❌ 시스템 의존성 설치 실패")
+            sys.exit(1)
+        
+        # 가상환경 생성 (완료 대기)
+        if not create_virtual_environment(venv_process):
+            print("❌ 가상환경 생성 실패")
+            sys.exit(1)
+    except BaseException:
+        # sys.exit / Ctrl+C 포함: 다음 실행이 반쯤 만들어진 venv를 "이미 존재"로 보지 않도록 정리
+        abort_virtual_environment(venv_process)
+        raise
     
     # Python 의존성 설치
     if not install_python_dependencies():
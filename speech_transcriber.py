@@ -1,57 +1,237 @@
 """
 음성 텍스트 변환 모듈
 """
-import whisper
 import speech_recognition as sr
 from pathlib import Path
 from typing import Optional, Dict
-from pydub import AudioSegment
-import tempfile
 import os
+import subprocess
+import wave
+import numpy as np
+import torch
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except ImportError:
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
+# 이 길이(ms) 이상의 무음 구간은 디코딩에서 제외 (인트로/아웃트로/음악 구간 제거)
+WHISPER_VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+# faster-whisper 연산 정밀도 (비우면 GPU는 int8_float16, CPU는 int8; 예: float16, int8)
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE")
+
+# 동시에 실행할 변환 수 (app.py의 WHISPER_CONCURRENCY와 같은 값) - CTranslate2 워커를 그만큼 두고
+# CPU 스레드를 나눠 가져 같은 모델로 여러 오디오를 병렬 처리
+WHISPER_WORKERS = max(1, int(os.getenv("WHISPER_CONCURRENCY", "1")))
+
+# VAD로 자른 음성 구간을 한 번에 인코딩할 배치 크기 (faster-whisper, 1 이하면 순차 디코딩)
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "16"))
+
+try:
+    import whisper
+except ImportError:
+    whisper = None
+
+# 투기적 디코딩 (medium/large, transformers): 작은 draft 모델이 토큰을 제안하고 큰 모델이 한 번에 검증
+# (greedy 결과는 큰 모델 단독과 동일)
+WHISPER_SPECULATIVE = os.getenv("WHISPER_SPECULATIVE", "false").lower() == "true"
+SPECULATIVE_MODELS = {"medium": "openai/whisper-medium", "large": "openai/whisper-large-v2"}
+SPECULATIVE_ASSISTANT_MODEL = "openai/whisper-tiny"
+
+# method='both'에서 Whisper 구간 평균 log 확률이 이 값보다 높으면 Google 인식 생략
+WHISPER_CONFIDENCE_THRESHOLD = float(os.getenv("WHISPER_CONFIDENCE_THRESHOLD", "-1.0"))
+
+# 파일이 없을 때 다운로드 폴더의 오디오 파일 목록까지 오류에 포함할지 여부
+TRANSCRIBER_DEBUG = os.getenv("TRANSCRIBER_DEBUG", "false").lower() == "true"
+
+# Whisper 입력 샘플레이트 (Google 인식에도 같은 PCM을 사용)
+SAMPLE_RATE = 16000
+
+
+def decode_audio(audio_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """ffmpeg로 오디오를 16비트 모노 PCM(int16 배열)으로 메모리에 바로 디코딩 (임시 파일 없음)"""
+    command = ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", audio_path,
+               "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-"]
+    output = subprocess.run(command, capture_output=True, check=True).stdout
+    return np.frombuffer(output, dtype=np.int16)
+
+
+def _is_pcm16_mono_wav(audio_path: str) -> bool:
+    """16비트 모노 PCM WAV인지 확인 (Google 인식에 변환 없이 바로 사용 가능)"""
+    if not audio_path.lower().endswith('.wav'):
+        return False
+    try:
+        with wave.open(audio_path, 'rb') as wav_file:
+            return wav_file.getsampwidth() == 2 and wav_file.getnchannels() == 1
+    except (wave.Error, EOFError, OSError):
+        return False
 
 
 class SpeechTranscriber:
-    def __init__(self, model_name: str = "base"):
+    def __init__(self, model_name: str = "base", backend: Optional[str] = None):
         """
         Args:
             model_name: Whisper 모델명 (tiny, base, small, medium, large)
+            backend: Whisper 백엔드 ('faster-whisper', 'whisper' 또는 'speculative',
+                     기본값은 WHISPER_BACKEND 환경변수, 없으면 faster-whisper.
+                     WHISPER_SPECULATIVE=true 이면 medium/large는 'speculative')
         """
         self.model_name = model_name
+        self.backend = backend or os.getenv("WHISPER_BACKEND", "faster-whisper")
+        if backend is None and WHISPER_SPECULATIVE and model_name in SPECULATIVE_MODELS:
+            self.backend = "speculative"
+        if self.backend == "faster-whisper" and WhisperModel is None:
+            print("⚠️  faster-whisper가 설치되지 않아 openai-whisper를 사용합니다.")
+            self.backend = "whisper"
         self.whisper_model = None
+        self.batched_pipeline = None
         self.recognizer = sr.Recognizer()
         
     def load_whisper_model(self):
         """Whisper 모델 로드 (지연 로딩)"""
         if self.whisper_model is None:
-            print(f"Whisper {self.model_name} 모델 로드 중...")
-            self.whisper_model = whisper.load_model(self.model_name)
+            print(f"Whisper {self.model_name} 모델 로드 중... ({self.backend})")
+            if self.backend == "faster-whisper":
+                # CTranslate2 int8 양자화 (GPU에서는 int8_float16)
+                use_cuda = torch.cuda.is_available()
+                options = dict(
+                    device="cuda" if use_cuda else "cpu",
+                    compute_type=WHISPER_COMPUTE_TYPE or ("int8_float16" if use_cuda else "int8"),
+                    cpu_threads=max(1, (os.cpu_count() or 1) // WHISPER_WORKERS),
+                    num_workers=WHISPER_WORKERS
+                )
+                try:
+                    # 이미 받은 모델이면 Hugging Face Hub 조회 없이 로컬 캐시에서 바로 로드
+                    self.whisper_model = WhisperModel(self.model_name, local_files_only=True, **options)
+                except Exception:
+                    self.whisper_model = WhisperModel(self.model_name, **options)
+                if WHISPER_BATCH_SIZE > 1:
+                    self.batched_pipeline = BatchedInferencePipeline(model=self.whisper_model)
+            elif self.backend == "speculative":
+                self.whisper_model = self._load_speculative_pipeline()
+            else:
+                self.whisper_model = whisper.load_model(self.model_name)
+                # mel 필터뱅크(lru_cache)를 로드 시점에 채워 첫 변환에서 npz를 읽지 않도록 함
+                whisper.audio.mel_filters(self.whisper_model.device, self.whisper_model.dims.n_mels)
+
+    def _load_speculative_pipeline(self):
+        """transformers Whisper + tiny draft 모델(assistant_model) 음성 인식 파이프라인 로드"""
+        from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+
+        use_cuda = torch.cuda.is_available()
+        dtype = torch.float16 if use_cuda else torch.float32
+        device = "cuda" if use_cuda else "cpu"
+        model_id = SPECULATIVE_MODELS[self.model_name]
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(
+            model_id, torch_dtype=dtype, low_cpu_mem_usage=True).to(device)
+        self.assistant_model = AutoModelForSpeechSeq2Seq.from_pretrained(
+            SPECULATIVE_ASSISTANT_MODEL, torch_dtype=dtype, low_cpu_mem_usage=True).to(device)
+        processor = AutoProcessor.from_pretrained(model_id)
+        return pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            torch_dtype=dtype,
+            device=device,
+            chunk_length_s=30,
+            batch_size=1  # assistant_model은 배치 크기 1만 지원
+        )
+
+    def _transcribe_with_speculative(self, audio) -> Dict[str, any]:
+        """투기적 디코딩으로 음성 인식 (openai-whisper와 같은 결과 형식, 구간 정보 없음)"""
+        output = self.whisper_model(
+            audio,
+            generate_kwargs={
+                "assistant_model": self.assistant_model,
+                "language": "korean",
+                "task": "transcribe",
+            }
+        )
+        return {
+            'text': output['text'],
+            'language': 'ko',
+            'segments': []
+        }
+
+    def _transcribe_with_faster_whisper(self, audio) -> Dict[str, any]:
+        """faster-whisper로 음성 인식 (openai-whisper와 같은 결과 형식)"""
+        if self.batched_pipeline is not None:
+            # Silero VAD로 나눈 음성 구간을 배치로 묶어 병렬 인코딩/디코딩 (결과는 시간순)
+            segments, info = self.batched_pipeline.transcribe(
+                audio,
+                language='ko',
+                task='transcribe',
+                beam_size=5,
+                batch_size=WHISPER_BATCH_SIZE,
+                vad_parameters=WHISPER_VAD_PARAMETERS,
+                without_timestamps=True
+            )
+        else:
+            segments, info = self.whisper_model.transcribe(
+                audio,
+                language='ko',
+                task='transcribe',
+                beam_size=5,
+                vad_filter=True,  # 무음 구간 제거로 디코딩량 감소
+                vad_parameters=WHISPER_VAD_PARAMETERS,
+                without_timestamps=True
+            )
+        segment_list = [
+            {'id': segment.id, 'start': segment.start, 'end': segment.end, 'text': segment.text,
+             'avg_logprob': segment.avg_logprob}
+            for segment in segments
+        ]
+        print(f"🔇 VAD: 전체 {info.duration:.0f}초 중 음성 {info.duration_after_vad:.0f}초만 디코딩")
+        return {
+            'text': ''.join(segment['text'] for segment in segment_list),
+            'language': info.language,
+            'segments': segment_list,
+            'duration': info.duration,
+            'speech_duration': info.duration_after_vad
+        }
     
-    def transcribe_with_whisper(self, audio_path: str) -> Dict[str, any]:
+    def transcribe_with_whisper(self, audio_path: str, pcm: Optional[np.ndarray] = None) -> Dict[str, any]:
         """
         Whisper를 사용한 음성 인식
         
         Args:
             audio_path: 오디오 파일 경로
+            pcm: 이미 디코딩된 16kHz 모노 PCM (있으면 파일을 다시 디코딩하지 않음)
             
         Returns:
             변환 결과 딕셔너리
         """
         try:
             self.load_whisper_model()
+            # 모든 백엔드가 16kHz float32 배열 입력을 지원
+            audio = pcm.astype(np.float32) / 32768.0 if pcm is not None else audio_path
             
-            result = self.whisper_model.transcribe(
-                audio_path,
-                language='ko',  # 한국어 우선, None으로 설정하면 자동 감지
-                task='transcribe'
-            )
+            if self.backend == "faster-whisper":
+                result = self._transcribe_with_faster_whisper(audio)
+            elif self.backend == "speculative":
+                result = self._transcribe_with_speculative(audio)
+            else:
+                result = self.whisper_model.transcribe(
+                    audio,
+                    language='ko',  # 한국어 우선, None으로 설정하면 자동 감지
+                    task='transcribe'
+                )
             
-            return {
+            transcription = {
                 'text': result['text'].strip(),
                 'language': result['language'],
                 'segments': result['segments'],
                 'success': True,
                 'method': 'whisper'
             }
+            # 원본 길이 / VAD로 남은 음성 길이 (faster-whisper만 제공)
+            for key in ('duration', 'speech_duration'):
+                if key in result:
+                    transcription[key] = result[key]
+            return transcription
             
         except Exception as e:
             return {
@@ -61,46 +241,46 @@ class SpeechTranscriber:
                 'method': 'whisper'
             }
     
-    def transcribe_with_google(self, audio_path: str) -> Dict[str, any]:
+    def transcribe_with_google(self, audio_path: str, pcm: Optional[np.ndarray] = None,
+                               language: str = 'ko-KR') -> Dict[str, any]:
         """
         Google Speech Recognition을 사용한 음성 인식
         
         Args:
             audio_path: 오디오 파일 경로
+            pcm: 이미 디코딩된 16kHz 모노 PCM (있으면 파일을 다시 디코딩하지 않음)
+            language: 먼저 시도할 언어 (인식 실패시 한국어/영어 중 다른 언어로 재시도)
             
         Returns:
             변환 결과 딕셔너리
         """
         try:
-            # 오디오 파일을 WAV로 변환 (Google API용)
-            audio = AudioSegment.from_file(audio_path)
-            
-            # 임시 WAV 파일 생성
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                audio.export(tmp_file.name, format='wav')
-                wav_path = tmp_file.name
+            if pcm is None and _is_pcm16_mono_wav(audio_path):
+                # 이미 16비트 모노 WAV면 ffmpeg 디코딩 없이 그대로 사용
+                with sr.AudioFile(audio_path) as source:
+                    audio_data = self.recognizer.record(source)
+            else:
+                # 그 외 포맷은 메모리에서 PCM으로 디코딩 (임시 WAV 파일 없음)
+                if pcm is None:
+                    pcm = decode_audio(audio_path)
+                # decode_audio 결과는 ffmpeg 출력 bytes를 그대로 감싸므로 복사 없이 사용
+                frame_data = pcm.base if isinstance(pcm.base, bytes) else pcm.tobytes()
+                audio_data = sr.AudioData(frame_data, SAMPLE_RATE, 2)
             
+            # 요청한 언어를 먼저 시도하고, 인식 실패시 다른 언어(한국어/영어)로 재시도
+            # (인스턴스는 여러 작업이 공유하므로 언어는 호출마다 전달받고 저장하지 않음)
             try:
-                # Google Speech Recognition
-                with sr.AudioFile(wav_path) as source:
-                    audio_data = self.recognizer.record(source)
-                
-                # 한국어 우선, 실패시 영어
-                try:
-                    text = self.recognizer.recognize_google(audio_data, language='ko-KR')
-                except sr.UnknownValueError:
-                    text = self.recognizer.recognize_google(audio_data, language='en-US')
-                
-                return {
-                    'text': text,
-                    'language': 'ko-KR',
-                    'success': True,
-                    'method': 'google'
-                }
-                
-            finally:
-                # 임시 파일 삭제
-                os.unlink(wav_path)
+                text = self.recognizer.recognize_google(audio_data, language=language)
+            except sr.UnknownValueError:
+                language = 'en-US' if language == 'ko-KR' else 'ko-KR'
+                text = self.recognizer.recognize_google(audio_data, language=language)
+            
+            return {
+                'text': text,
+                'language': language,
+                'success': True,
+                'method': 'google'
+            }
                 
         except sr.UnknownValueError:
             return {
@@ -124,13 +304,70 @@ class SpeechTranscriber:
                 'method': 'google'
             }
     
-    def transcribe(self, audio_path: str, method: str = 'whisper') -> Dict[str, any]:
+    @staticmethod
+    def _decode(audio_path: str) -> Optional[np.ndarray]:
+        """16kHz 모노 PCM으로 디코딩 (실패하면 None - 엔진이 파일을 직접 읽음)
+
+        인스턴스는 여러 작업이 공유하므로 결과를 보관하지 않음 - 한 번의 transcribe() 호출 안에서만
+        두 엔진이 같은 배열을 쓰고, 호출이 끝나면 해제됨
+        """
+        try:
+            return decode_audio(audio_path)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"⚠️  오디오 디코딩 실패, 엔진별로 파일을 읽습니다: {e}")
+            return None
+
+    def prepare_audio(self, audio_path: str, method: str = 'whisper') -> Optional[np.ndarray]:
+        """transcribe()에 넘길 PCM을 미리 디코딩 (모델을 기다리는 동안 ffmpeg 디코딩을 겹쳐 실행)"""
+        if method not in ('whisper', 'both') or not os.path.exists(audio_path):
+            return None
+        return self._decode(audio_path)
+
+    @staticmethod
+    def is_confident(result: Dict[str, any]) -> bool:
+        """Whisper 결과가 성공했고 구간 평균 log 확률이 임계값보다 높은지 (구간 정보가 없으면 False)"""
+        if not result.get('success') or not result.get('text', '').strip():
+            return False
+        logprobs = [s['avg_logprob'] for s in result.get('segments', []) if 'avg_logprob' in s]
+        return bool(logprobs) and sum(logprobs) / len(logprobs) > WHISPER_CONFIDENCE_THRESHOLD
+
+    def _missing_file_result(self, audio_path: str) -> Dict[str, any]:
+        """파일이 없을 때의 오류 결과 (TRANSCRIBER_DEBUG=true 이면 디렉토리의 오디오 파일 목록 포함)"""
+        directory = os.path.dirname(audio_path)
+        if not os.path.isdir(directory or '.'):
+            return {
+                'text': '',
+                'error': f'파일을 찾을 수 없습니다: {audio_path}\n디렉토리도 존재하지 않습니다: {directory}',
+                'success': False
+            }
+        if not TRANSCRIBER_DEBUG:
+            return {
+                'text': '',
+                'error': f'파일을 찾을 수 없습니다: {audio_path}',
+                'success': False
+            }
+        
+        # 디렉토리 내용 확인 (큰 디렉토리에서는 비용이 크므로 디버그 모드에서만)
+        files = [f for f in os.listdir(directory or '.') if f.lower().endswith(('.mp3', '.wav', '.m4a', '.ogg'))]
+        file_list = ', '.join(files[:5])  # 처음 5개만 표시
+        more_files = f" (그 외 {len(files)-5}개 더)" if len(files) > 5 else ""
+        return {
+            'text': '',
+            'error': f'파일을 찾을 수 없습니다: {audio_path}\n' + 
+                    f'디렉토리 {directory}의 오디오 파일들: {file_list}{more_files}',
+            'success': False
+        }
+    
+    def transcribe(self, audio_path: str, method: str = 'whisper',
+                   pcm: Optional[np.ndarray] = None, google_language: str = 'ko-KR') -> Dict[str, any]:
         """
         음성을 텍스트로 변환
         
         Args:
             audio_path: 오디오 파일 경로
             method: 변환 방법 ('whisper', 'google', 'both')
+            pcm: prepare_audio()로 미리 디코딩한 PCM (없으면 여기서 디코딩)
+            google_language: Google 인식에서 먼저 시도할 언어
             
         Returns:
             변환 결과
@@ -143,37 +380,11 @@ class SpeechTranscriber:
                 'success': False
             }
             
-        if not os.path.exists(audio_path):
-            # 파일이 없는 경우 디렉토리 내용 확인
-            directory = os.path.dirname(audio_path)
-            if os.path.exists(directory):
-                files = [f for f in os.listdir(directory) if f.lower().endswith(('.mp3', '.wav', '.m4a', '.ogg'))]
-                file_list = ', '.join(files[:5])  # 처음 5개만 표시
-                more_files = f" (그 외 {len(files)-5}개 더)" if len(files) > 5 else ""
-                
-                return {
-                    'text': '',
-                    'error': f'파일을 찾을 수 없습니다: {audio_path}\n' + 
-                            f'디렉토리 {directory}의 오디오 파일들: {file_list}{more_files}',
-                    'success': False
-                }
-            else:
-                return {
-                    'text': '',
-                    'error': f'파일을 찾을 수 없습니다: {audio_path}\n디렉토리도 존재하지 않습니다: {directory}',
-                    'success': False
-                }
-        
-        # 파일 크기 확인
+        # 존재 여부와 크기를 stat 한 번으로 확인
         try:
-            file_size = os.path.getsize(audio_path)
-            if file_size == 0:
-                return {
-                    'text': '',
-                    'error': f'오디오 파일이 비어있습니다: {audio_path}',
-                    'success': False
-                }
-            print(f"📁 오디오 파일 크기: {file_size / 1024 / 1024:.2f} MB")
+            stat = os.stat(audio_path)
+        except FileNotFoundError:
+            return self._missing_file_result(audio_path)
         except OSError as e:
             return {
                 'text': '',
@@ -181,18 +392,41 @@ class SpeechTranscriber:
                 'success': False
             }
         
+        file_size = stat.st_size
+        if file_size == 0:
+            return {
+                'text': '',
+                'error': f'오디오 파일이 비어있습니다: {audio_path}',
+                'success': False
+            }
+        print(f"📁 오디오 파일 크기: {file_size / 1024 / 1024:.2f} MB")
+        
         if method == 'whisper':
-            return self.transcribe_with_whisper(audio_path)
+            return self.transcribe_with_whisper(audio_path, pcm=pcm if pcm is not None else self._decode(audio_path))
         elif method == 'google':
-            return self.transcribe_with_google(audio_path)
+            return self.transcribe_with_google(audio_path, language=google_language)
         elif method == 'both':
-            # 두 방법 모두 시도
-            whisper_result = self.transcribe_with_whisper(audio_path)
-            google_result = self.transcribe_with_google(audio_path)
+            # 두 방법 모두 시도 (오디오는 한 번만 16kHz 모노로 디코딩해서 공유)
+            if pcm is None:
+                pcm = self._decode(audio_path)
+            whisper_result = self.transcribe_with_whisper(audio_path, pcm=pcm)
+            # Whisper 결과를 믿을 만하면 Google 요청(네트워크 왕복)은 생략
+            skipped_google = self.is_confident(whisper_result)
+            if skipped_google:
+                print("⏭️  Whisper 신뢰도가 충분해 Google 인식을 건너뜁니다")
+                google_result = {
+                    'text': '',
+                    'error': 'Whisper 결과 신뢰도가 충분해 건너뛰었습니다',
+                    'success': False,
+                    'method': 'google'
+                }
+            else:
+                google_result = self.transcribe_with_google(audio_path, pcm=pcm, language=google_language)
             
             return {
                 'whisper': whisper_result,
                 'google': google_result,
+                'skipped_google': skipped_google,
                 'success': True,
                 'method': 'both'
             }
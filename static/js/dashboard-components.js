@@ -10,6 +10,7 @@ class DashboardState {
         this.isProcessing = false;
         this.results = null;
         this.statusCheckInterval = null;
+        this.statusEventSource = null;
     }
 
     setJobId(jobId) {
@@ -29,6 +30,10 @@ class DashboardState {
             clearInterval(this.statusCheckInterval);
             this.statusCheckInterval = null;
         }
+        if (this.statusEventSource) {
+            this.statusEventSource.close();
+            this.statusEventSource = null;
+        }
     }
 }
 
@@ -209,7 +214,8 @@ const ResultComponents = {
         let scriptText = '';
         
         if (result.method === 'both') {
-            scriptText = `Whisper Results:\n${result.whisper.text || 'Transcription failed'}\n\nGoogle Results:\n${result.google.text || 'Transcription failed'}`;
+            const googleText = ResultComponents.googleText(result);
+            scriptText = `Whisper Results:\n${result.whisper.text || 'Transcription failed'}\n\nGoogle Results:\n${googleText}`;
             html += `
                 <div class="result-section">
                     <h4 class="result-header">🤖 Whisper Results:</h4>
@@ -220,7 +226,7 @@ const ResultComponents = {
                 <div class="result-section">
                     <h4 class="result-header">🌐 Google Results:</h4>
                     <div class="result-content" role="region" aria-label="Google transcription results">
-                        ${ResultComponents.formatText(result.google.text || 'Transcription failed')}
+                        ${ResultComponents.formatText(googleText)}
                     </div>
                 </div>
             `;
@@ -255,6 +261,12 @@ const ResultComponents = {
         SummarizationComponents.getTimelineSummary(scriptText);
     },
 
+    // Google text for method='both' (may be skipped when Whisper was confident)
+    googleText: (result) => {
+        if (result.skipped_google) return 'Skipped (Whisper result was confident)';
+        return result.google.text || 'Transcription failed';
+    },
+
     // Format text for display with improved paragraph breaks
     formatText: (text) => {
         // Split by double newlines for paragraph breaks
@@ -277,43 +289,65 @@ const ResultComponents = {
 
 // Summarization Components
 const SummarizationComponents = {
+    // Fetch an array summary as NDJSON and call onItems with the items received so far
+    streamItems: async (url, text, onItems) => {
+        const response = await fetch(`${url}?stream=true`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ text })
+        });
+        if (!response.ok || !response.body) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const items = [];
+        let buffer = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            const received = lines.filter(line => line.trim()).map(line => JSON.parse(line));
+            if (received.length > 0) {
+                items.push(...received);
+                onItems(items);
+            }
+        }
+        if (buffer.trim()) {
+            items.push(JSON.parse(buffer));
+        }
+        onItems(items);
+        return items;
+    },
+
     getSummaries: async (text) => {
         // Show loading state for summaries
         document.getElementById('keySummaryContent').innerHTML = '<div class="loading-spinner"></div> 요약 중...';
         document.getElementById('curatorContent').innerHTML = '<div class="loading-spinner"></div> 요약 중...';
 
-        try {
-            const [keySummaryResponse, curatorResponse] = await Promise.all([
-                fetch('/summarize/key_summary', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ text })
-                }),
-                fetch('/summarize/curator', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ text })
-                })
-            ]);
-
-            if (keySummaryResponse.ok) {
-                const summary = await keySummaryResponse.json();
-                SummarizationComponents.showKeySummary(summary);
-            } else {
-                SummarizationComponents.showKeySummary({ error: 'Failed to load summary.' });
-            }
-
-            if (curatorResponse.ok) {
-                const summary = await curatorResponse.json();
-                SummarizationComponents.showCuratorSummary(summary);
-            } else {
-                SummarizationComponents.showCuratorSummary({ error: 'Failed to load summary.' });
-            }
+        const keySummary = SummarizationComponents
+            .streamItems('/summarize/key_summary', text, SummarizationComponents.showKeySummary)
+            .catch(() => SummarizationComponents.showKeySummary({ error: 'Failed to load summary.' }));
+
+        const curator = fetch('/summarize/curator', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ text })
+        })
+            .then(async (curatorResponse) => {
+                if (curatorResponse.ok) {
+                    const summary = await curatorResponse.json();
+                    SummarizationComponents.showCuratorSummary(summary);
+                } else {
+                    SummarizationComponents.showCuratorSummary({ error: 'Failed to load summary.' });
+                }
+            })
+            .catch(() => SummarizationComponents.showCuratorSummary({ error: 'Error fetching summaries.' }));
 
-        } catch (error) {
-            SummarizationComponents.showKeySummary({ error: 'Error fetching summaries.' });
-            SummarizationComponents.showCuratorSummary({ error: 'Error fetching summaries.' });
-        }
+        await Promise.all([keySummary, curator]);
     },
 
     getTimelineSummary: async (text) => {
@@ -330,23 +364,11 @@ const SummarizationComponents = {
         console.log('Loading state set for timeline summary');
 
         try {
-            console.log('Fetching timeline summary from API...');
-            const response = await fetch('/summarize/timeline_summary', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ text })
-            });
-
-            console.log('API response status:', response.status);
-            
-            if (response.ok) {
-                const summary = await response.json();
-                console.log('Timeline summary received:', summary);
-                SummarizationComponents.showTimelineSummary(summary);
-            } else {
-                console.error('API response not ok:', response.status, response.statusText);
-                SummarizationComponents.showTimelineSummary({ error: 'Failed to load timeline summary.' });
-            }
+            console.log('Streaming timeline summary from API...');
+            const summary = await SummarizationComponents.streamItems(
+                '/summarize/timeline_summary', text, SummarizationComponents.showTimelineSummary
+            );
+            console.log('Timeline summary received:', summary);
 
         } catch (error) {
             console.error('Error in getTimelineSummary:', error);
@@ -514,7 +536,7 @@ const DownloadComponents = {
             text += 'Whisper Results:\n';
             text += (result.whisper.text || 'Transcription failed') + '\n\n';
             text += 'Google Results:\n';
-            text += (result.google.text || 'Transcription failed');
+            text += ResultComponents.googleText(result);
         } else {
             text = result.text || 'Transcription failed';
         }
@@ -616,7 +638,7 @@ const DashboardController = {
             
             if (response.ok) {
                 dashboardState.setJobId(data.job_id);
-                DashboardController.checkStatus();
+                DashboardController.watchStatus();
             } else {
                 throw new Error(data.detail || 'Transcription failed');
             }
@@ -626,7 +648,33 @@ const DashboardController = {
         }
     },
 
-    // Check transcription status
+    // Watch transcription status (SSE stream, polling fallback)
+    watchStatus: () => {
+        if (!dashboardState.currentJobId) return;
+        
+        if (!('EventSource' in window)) {
+            DashboardController.checkStatus();
+            return;
+        }
+        
+        const source = new EventSource(`/status_stream/${dashboardState.currentJobId}`);
+        dashboardState.statusEventSource = source;
+        
+        source.onmessage = (event) => {
+            DashboardController.handleStatus(JSON.parse(event.data));
+        };
+        
+        source.onerror = () => {
+            // Stream closed or unavailable - fall back to polling if still running
+            if (dashboardState.statusEventSource !== source) return;
+            dashboardState.clearStatusCheck();
+            if (dashboardState.isProcessing) {
+                DashboardController.checkStatus();
+            }
+        };
+    },
+
+    // Check transcription status (polling)
     checkStatus: async () => {
         if (!dashboardState.currentJobId) return;
         
@@ -634,21 +682,7 @@ const DashboardController = {
             const response = await fetch(`/status/${dashboardState.currentJobId}`);
             const data = await response.json();
             
-            StatusComponents.update(data.status);
-            
-            if (data.completed) {
-                dashboardState.clearStatusCheck();
-                
-                if (data.success) {
-                    dashboardState.setResults(data.result);
-                    ResultComponents.show(data.result);
-                    StatusComponents.hide();
-                } else {
-                    DashboardController.handleError('Transcription failed: ' + (data.error || 'Unknown error'));
-                }
-                
-                DashboardController.setProcessingState(false);
-            } else {
+            if (!DashboardController.handleStatus(data)) {
                 // Continue checking status
                 dashboardState.statusCheckInterval = setTimeout(DashboardController.checkStatus, 2000);
             }
@@ -658,6 +692,26 @@ const DashboardController = {
         }
     },
 
+    // Apply a status update; returns true when the job has finished
+    handleStatus: (data) => {
+        StatusComponents.update(data.status);
+        
+        if (!data.completed) return false;
+        
+        dashboardState.clearStatusCheck();
+        
+        if (data.success) {
+            dashboardState.setResults(data.result);
+            ResultComponents.show(data.result);
+            StatusComponents.hide();
+        } else {
+            DashboardController.handleError('Transcription failed: ' + (data.error || 'Unknown error'));
+        }
+        
+        DashboardController.setProcessingState(false);
+        return true;
+    },
+
     // Handle errors
     handleError: (message) => {
         FormComponents.showErrors([message]);
@@ -5,14 +5,106 @@ Tests WCAG 2.1 AA compliance and accessibility best practices
 """
 
 import asyncio
-import json
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 import re
 from urllib.parse import urljoin
 import aiohttp
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+from itertools import islice
 import sys
 
+try:
+    # Lexbor (C) HTML5 parser: several times faster than bs4 + lxml for tree build and walk
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401  (C parser, much faster than the pure-Python html.parser)
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Tags and attributes the _test_* methods query; everything else (wrapper divs, <script> bodies)
+# is skipped while parsing
+STRAINER_TAGS = frozenset([
+    'meta', 'title', 'style', 'link', 'main', 'header', 'footer', 'nav',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'form', 'fieldset', 'legend',
+    'label', 'input', 'select', 'textarea', 'button', 'a', 'img', 'svg'
+])
+STRAINER_ATTRS = frozenset(['id', 'aria-live', 'role', 'tabindex', 'onclick', 'autocomplete', 'required'])
+
+
+class AccessibilityStrainer(SoupStrainer):
+    """Keep a tag (and its whole subtree) if the tests query its name or one of its attributes"""
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return name in STRAINER_TAGS or bool(attrs and STRAINER_ATTRS.intersection(attrs))
+
+
+STRAINER = AccessibilityStrainer()
+
+
+class LexborTag:
+    """bs4.Tag-like view of a selectolax node, covering only what the checks use"""
+
+    __slots__ = ('node', 'name', 'attrs')
+    string = None  # no single-string shortcut; callers fall back to get_text()
+
+    def __init__(self, node):
+        self.node = node
+        self.name = node.tag
+        # Valueless attributes (required, bare tabindex) are None in selectolax but '' in bs4
+        self.attrs = {key: '' if value is None else value for key, value in node.attributes.items()}
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def find(self, name):
+        node = self.node.css_first(name)
+        return LexborTag(node) if node is not None else None
+
+    def find_all(self, name=True):
+        """All descendant elements in document order (only find_all(True) is needed)"""
+        return [LexborTag(node) for node in islice(self.node.traverse(), 1, None)]
+
+    def get_text(self, strip=False):
+        return self.node.text(strip=strip)
+
+# Groups of tags the tests query together; each group keeps document order like find_all([...])
+TAG_GROUPS = {
+    'h1': ('headings',), 'h2': ('headings',), 'h3': ('headings',),
+    'h4': ('headings',), 'h5': ('headings',), 'h6': ('headings',),
+    'ul': ('lists',), 'ol': ('lists',),
+    'input': ('form_controls', 'focusable'), 'select': ('form_controls', 'focusable'),
+    'textarea': ('form_controls', 'focusable'),
+    'a': ('focusable',), 'button': ('focusable',),
+}
+# Attributes indexed as '[attr]' buckets (tags that have the attribute)
+INDEXED_ATTRS = ('aria-live', 'tabindex', 'onclick', 'autocomplete')
+INDEXED_ATTR_KEYS = {attr: f'[{attr}]' for attr in INDEXED_ATTRS}
+
+# CSS features the tests look for in embedded <style>, matched in a single regex pass.
+# Longest first so ':focus-visible' is not consumed as ':focus'; shorter keywords contained
+# in a longer hit are still counted when the hits are resolved (see css_features)
+FOCUS_STYLES = (':focus', ':focus-visible', ':focus-within')
+CSS_KEYWORDS = (':root', '--', 'prefers-color-scheme', 'prefers-contrast', 'prefers-reduced-motion') + FOCUS_STYLES
+CSS_KEYWORDS_RE = re.compile('|'.join(map(re.escape, sorted(CSS_KEYWORDS, key=len, reverse=True))))
+
+
+@lru_cache(maxsize=64)
+def css_features(css_content):
+    """CSS_KEYWORDS present in css_content (cached by content, so a re-run or another page with
+    the same embedded CSS skips the scan)"""
+    hits = set(CSS_KEYWORDS_RE.findall(css_content))
+    return frozenset(keyword for keyword in CSS_KEYWORDS if any(keyword in hit for hit in hits))
+
 
 class AccessibilityTester:
     def __init__(self, base_url="http://localhost:8000"):
@@ -24,58 +116,134 @@ class AccessibilityTester:
             'score': 0,
             'total_tests': 0
         }
+        self.session = None
+        self._css_features = frozenset()
+        self._id_index = {}
+        self._label_index = {}
+        # Checks per outcome; an aggregated message can stand for several checks
+        self._counts = {'passed': 0, 'failed': 0, 'warnings': 0}
+
+    async def __aenter__(self):
+        """Open one keep-alive HTTP session for the tester's lifetime"""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
 
     async def run_all_tests(self):
         """Run all accessibility tests"""
         print("🔍 Starting Accessibility Testing Suite")
         print("=" * 50)
         
+        # Reuse the session from `async with AccessibilityTester(...)`, else open one for this run
+        owns_session = self.session is None
+        if owns_session:
+            await self.__aenter__()
         try:
-            async with aiohttp.ClientSession() as session:
-                html_content = await self._fetch_page(session, "/")
-                if not html_content:
-                    print("❌ Could not fetch homepage")
-                    return self.results
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Run all test categories
-                await self._test_semantic_html(soup)
-                await self._test_aria_attributes(soup)
-                await self._test_keyboard_navigation(soup)
-                await self._test_color_contrast(soup)
-                await self._test_images_and_media(soup)
-                await self._test_forms_accessibility(soup)
-                await self._test_focus_management(soup)
-                await self._test_mobile_accessibility(soup)
-                
-                # Calculate final score
-                self._calculate_score()
-                self._print_results()
-                
+            page = await self._fetch_page(self.session, "/")
+            if not page or not page[0]:
+                print("❌ Could not fetch homepage")
+                return self.results
+            
+            tags = self._collect_tags(self._parse_page(*page))
+            self._css_features = self._scan_css(tags['style'])
+            
+            # Run all test categories (read-only over the buckets; none awaits internally, so the
+            # tasks still run start-to-finish in this order and report in a stable order)
+            await asyncio.gather(
+                self._test_semantic_html(tags),
+                self._test_aria_attributes(tags),
+                self._test_keyboard_navigation(tags),
+                self._test_color_contrast(tags),
+                self._test_images_and_media(tags),
+                self._test_forms_accessibility(tags),
+                self._test_focus_management(tags),
+                self._test_mobile_accessibility(tags),
+            )
+            
+            # Calculate final score
+            self._calculate_score()
+            self._print_results()
+            
         except Exception as e:
             print(f"❌ Error during testing: {e}")
+        finally:
+            if owns_session:
+                await self.__aexit__(None, None, None)
             
         return self.results
 
+    @staticmethod
+    def _parse_page(html_content, encoding):
+        """Parse the page with selectolax (Lexbor) if installed, else BeautifulSoup"""
+        if LexborHTMLParser is not None:
+            if encoding and encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                html_content = html_content.decode(encoding, errors='replace')
+            # Undeclared bytes: honour <meta charset> like bs4 does
+            return LexborTag(LexborHTMLParser(html_content, encoding=encoding is None).root)
+        # lxml parses the raw bytes natively (no str decode / re-encode round trip)
+        return BeautifulSoup(html_content, HTML_PARSER, parse_only=STRAINER, from_encoding=encoding)
+
+    def _collect_tags(self, soup):
+        """Bucket every tag by name, TAG_GROUPS group and INDEXED_ATTRS in one tree walk
+
+        The same walk fills self._id_index (id -> first element with it, like soup.find(id=...))
+        and self._label_index (for -> first <label> pointing at it).
+        """
+        tags = defaultdict(list)
+        id_index, label_index = {}, {}
+        for tag in soup.find_all(True):
+            name, attrs = tag.name, tag.attrs
+            tags[name].append(tag)
+            for group in TAG_GROUPS.get(name, ()):
+                tags[group].append(tag)
+            if not attrs:
+                continue
+            tag_id = attrs.get('id')
+            if tag_id and tag_id not in id_index:
+                id_index[tag_id] = tag
+            if name == 'label':
+                label_for = attrs.get('for')
+                if label_for and label_for not in label_index:
+                    label_index[label_for] = tag
+            for attr, key in INDEXED_ATTR_KEYS.items():
+                if attr in attrs:
+                    tags[key].append(tag)
+        self._id_index = id_index
+        self._label_index = label_index
+        return tags
+
+    @staticmethod
+    def _scan_css(style_tags):
+        """CSS_KEYWORDS present in the embedded CSS, from one regex pass over the joined <style> text"""
+        return css_features(''.join(style.get_text() for style in style_tags))
+
+    def _css_has(self, keyword):
+        """Whether the embedded CSS contains keyword (one of CSS_KEYWORDS)"""
+        return keyword in self._css_features
+
     async def _fetch_page(self, session, path):
-        """Fetch page content"""
+        """Fetch page body as bytes with its declared charset (None lets bs4 detect it)"""
         try:
             url = urljoin(self.base_url, path)
             async with session.get(url) as response:
-                return await response.text()
+                return await response.read(), response.charset
         except Exception as e:
             print(f"Error fetching {path}: {e}")
             return None
 
-    async def _test_semantic_html(self, soup):
+    async def _test_semantic_html(self, tags):
         """Test semantic HTML structure"""
         print("\n🏗️  Testing Semantic HTML Structure...")
         
         # Test for proper heading hierarchy
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        headings = tags['headings']
         if headings:
-            h1_count = len(soup.find_all('h1'))
+            h1_count = len(tags['h1'])
             if h1_count == 1:
                 self._pass("Single H1 element found")
             elif h1_count == 0:
@@ -94,12 +262,7 @@ class AccessibilityTester:
             self._fail("No heading elements found")
 
         # Test for semantic landmarks
-        landmarks = {
-            'main': soup.find('main'),
-            'header': soup.find('header'),
-            'footer': soup.find('footer'),
-            'nav': soup.find('nav')
-        }
+        landmarks = {name: next(iter(tags[name]), None) for name in ('main', 'header', 'footer', 'nav')}
         
         if landmarks['main']:
             self._pass("Main landmark found")
@@ -112,79 +275,85 @@ class AccessibilityTester:
             self._warn("Header landmark missing")
             
         # Test for proper list usage
-        lists = soup.find_all(['ul', 'ol'])
-        for list_elem in lists:
+        for list_elem in tags['lists']:
             if not list_elem.find('li'):
                 self._warn(f"Empty list found: {list_elem.name}")
 
-    async def _test_aria_attributes(self, soup):
+    async def _test_aria_attributes(self, tags):
         """Test ARIA attributes and roles"""
         print("\n♿ Testing ARIA Attributes...")
         
         # Test for ARIA live regions
-        live_regions = soup.find_all(attrs={'aria-live': True})
+        live_regions = tags['[aria-live]']
         if live_regions:
             self._pass(f"ARIA live regions found ({len(live_regions)})")
-            for region in live_regions:
-                if region.get('aria-atomic'):
-                    self._pass("ARIA live region has aria-atomic")
+            atomic = sum(1 for region in live_regions if region.get('aria-atomic'))
+            if atomic:
+                self._pass("ARIA live region has aria-atomic", atomic)
         else:
             self._warn("No ARIA live regions found")
             
         # Test form labels and descriptions
-        inputs = soup.find_all(['input', 'select', 'textarea'])
-        for input_elem in inputs:
-            input_id = input_elem.get('id')
+        # Collect control ids per outcome, then report each outcome once
+        labeled, aria_labeled, unlabeled, described, bad_description = [], [], [], [], []
+        for input_elem in tags['form_controls']:
+            attrs = input_elem.attrs  # plain dict; skips Tag.get() on every lookup below
+            input_id = attrs.get('id')
             if input_id:
                 # Check for associated label
-                label = soup.find('label', attrs={'for': input_id})
-                if label:
-                    self._pass(f"Form control {input_id} has associated label")
+                if input_id in self._label_index:
+                    labeled.append(input_id)
+                elif attrs.get('aria-label'):
+                    aria_labeled.append(input_id)
                 else:
-                    aria_label = input_elem.get('aria-label')
-                    if aria_label:
-                        self._pass(f"Form control {input_id} has aria-label")
-                    else:
-                        self._fail(f"Form control {input_id} missing label")
+                    unlabeled.append(input_id)
                         
                 # Check for descriptions
-                aria_describedby = input_elem.get('aria-describedby')
+                aria_describedby = attrs.get('aria-describedby')
                 if aria_describedby:
-                    desc_elem = soup.find(id=aria_describedby)
-                    if desc_elem:
-                        self._pass(f"Form control {input_id} has description")
+                    if aria_describedby in self._id_index:
+                        described.append(input_id)
                     else:
-                        self._warn(f"Form control {input_id} references non-existent description")
+                        bad_description.append(input_id)
+        
+        self._report_ids(self._pass, "Form control {} has associated label", labeled)
+        self._report_ids(self._pass, "Form control {} has aria-label", aria_labeled)
+        self._report_ids(self._fail, "Form control {} missing label", unlabeled)
+        self._report_ids(self._pass, "Form control {} has description", described)
+        self._report_ids(self._warn, "Form control {} references non-existent description", bad_description)
                         
         # Test for proper roles
-        buttons = soup.find_all('button')
-        for button in buttons:
-            if not button.get('aria-label') and not button.get_text(strip=True):
-                self._warn("Button without accessible text found")
+        unnamed_buttons = sum(1 for button in tags['button']
+                              if not button.get('aria-label') and not button.get_text(strip=True))
+        if unnamed_buttons:
+            self._warn("Button without accessible text found", unnamed_buttons)
                 
         # Test for skip links
-        skip_links = soup.find_all('a', href=lambda x: x and x.startswith('#'))
-        if any('skip' in link.get_text().lower() for link in skip_links):
+        # One pass over anchors, stopping at the first match; `.string` avoids a get_text() walk
+        # for the usual text-only link (nested markup still falls back to get_text())
+        if any((link.get('href') or '').startswith('#')
+               and 'skip' in (link.string if link.string is not None else link.get_text()).lower()
+               for link in tags['a']):
             self._pass("Skip navigation link found")
         else:
             self._warn("No skip navigation link found")
 
-    async def _test_keyboard_navigation(self, soup):
+    async def _test_keyboard_navigation(self, tags):
         """Test keyboard navigation support"""
         print("\n⌨️  Testing Keyboard Navigation...")
         
         # Test for focusable elements
-        focusable_elements = soup.find_all(['a', 'button', 'input', 'select', 'textarea'])
-        focusable_elements.extend(soup.find_all(attrs={'tabindex': True}))
+        focusable_elements = tags['focusable'] + tags['[tabindex]']
         
         if focusable_elements:
             self._pass(f"Focusable elements found ({len(focusable_elements)})")
             
             # Check for tabindex usage
-            negative_tabindex = soup.find_all(attrs={'tabindex': '-1'})
-            positive_tabindex = soup.find_all(lambda tag: tag.get('tabindex') and 
-                                             tag.get('tabindex').isdigit() and 
-                                             int(tag.get('tabindex')) > 0)
+            # Filter the small [tabindex] bucket instead of calling a Python predicate on every node
+            tabindexed = tags['[tabindex]']
+            negative_tabindex = [tag for tag in tabindexed if tag['tabindex'] == '-1']
+            positive_tabindex = [tag for tag in tabindexed
+                                 if tag['tabindex'].isdigit() and int(tag['tabindex']) > 0]
             
             if positive_tabindex:
                 self._warn(f"Positive tabindex found ({len(positive_tabindex)} elements)")
@@ -192,117 +361,112 @@ class AccessibilityTester:
                 self._pass("No positive tabindex values found")
                 
         # Test for keyboard event handlers
-        elements_with_click = soup.find_all(attrs={'onclick': True})
+        elements_with_click = tags['[onclick]']
         if elements_with_click:
             self._warn(f"Elements with onclick handlers found ({len(elements_with_click)})")
 
-    async def _test_color_contrast(self, soup):
+    async def _test_color_contrast(self, tags):
         """Test color contrast (basic CSS analysis)"""
         print("\n🎨 Testing Color and Contrast...")
         
-        # Check for CSS custom properties (design system)
-        css_content = ""
-        style_tags = soup.find_all('style')
-        for style in style_tags:
-            css_content += style.get_text()
-            
-        # Look for CSS custom properties
-        if ':root' in css_content and '--' in css_content:
+        # Look for CSS custom properties (design system)
+        if self._css_has(':root') and self._css_has('--'):
             self._pass("CSS custom properties (design system) found")
         else:
             self._warn("No CSS design system detected")
             
         # Check for prefers-color-scheme media query
-        if 'prefers-color-scheme' in css_content:
+        if self._css_has('prefers-color-scheme'):
             self._pass("Dark mode support detected")
         else:
             self._warn("No dark mode support detected")
             
         # Check for high contrast support
-        if 'prefers-contrast' in css_content:
+        if self._css_has('prefers-contrast'):
             self._pass("High contrast mode support detected")
         else:
             self._warn("No high contrast mode support detected")
 
-    async def _test_images_and_media(self, soup):
+    async def _test_images_and_media(self, tags):
         """Test images and media accessibility"""
         print("\n🖼️  Testing Images and Media...")
         
-        # Test images for alt text
-        images = soup.find_all('img')
-        for img in images:
+        # Test images for alt text (one pass, one aggregated message per outcome)
+        descriptive = empty = missing = decorative = 0
+        for img in tags['img']:
             alt = img.get('alt')
-            if alt is not None:
-                if alt.strip():
-                    self._pass(f"Image has descriptive alt text")
-                else:
-                    self._pass(f"Image has empty alt text (decorative)")
+            if alt is None:
+                missing += 1
+            elif alt.strip():
+                descriptive += 1
             else:
-                self._fail(f"Image missing alt attribute")
+                empty += 1
+                if alt == "":
+                    decorative += 1
+        if descriptive:
+            self._pass("Image has descriptive alt text", descriptive)
+        if empty:
+            self._pass("Image has empty alt text (decorative)", empty)
+        if missing:
+            self._fail("Image missing alt attribute", missing)
                 
         # Test for decorative images
-        decorative_images = soup.find_all('img', alt="")
-        if decorative_images:
-            self._pass(f"Decorative images properly marked ({len(decorative_images)})")
+        if decorative:
+            self._pass(f"Decorative images properly marked ({decorative})")
             
         # Test SVG accessibility
-        svgs = soup.find_all('svg')
-        for svg in svgs:
-            if svg.get('aria-hidden') or svg.get('role') or svg.find('title'):
-                self._pass("SVG has accessibility attributes")
-            else:
-                self._warn("SVG may need accessibility attributes")
+        accessible_svgs = sum(1 for svg in tags['svg']
+                              if svg.get('aria-hidden') or svg.get('role') or svg.find('title'))
+        if accessible_svgs:
+            self._pass("SVG has accessibility attributes", accessible_svgs)
+        if len(tags['svg']) > accessible_svgs:
+            self._warn("SVG may need accessibility attributes", len(tags['svg']) - accessible_svgs)
 
-    async def _test_forms_accessibility(self, soup):
+    async def _test_forms_accessibility(self, tags):
         """Test form accessibility"""
         print("\n📝 Testing Form Accessibility...")
         
-        forms = soup.find_all('form')
+        forms = tags['form']
         if forms:
             for form in forms:
+                # One walk over the form's subtree for fieldsets, required fields and error regions
+                fieldsets, required_inputs, error_elements = [], [], []
+                for elem in form.find_all(True):
+                    if elem.name == 'fieldset':
+                        fieldsets.append(elem)
+                    if 'required' in elem.attrs:
+                        required_inputs.append(elem)
+                    if elem.get('role') == 'alert' or elem.get('aria-live') == 'assertive':
+                        error_elements.append(elem)
+                
                 # Test for fieldsets and legends
-                fieldsets = form.find_all('fieldset')
-                if fieldsets:
-                    for fieldset in fieldsets:
-                        legend = fieldset.find('legend')
-                        if legend:
-                            self._pass("Fieldset has legend")
-                        else:
-                            self._warn("Fieldset missing legend")
-                            
+                with_legend = sum(1 for fieldset in fieldsets if fieldset.find('legend'))
+                if with_legend:
+                    self._pass("Fieldset has legend", with_legend)
+                if len(fieldsets) > with_legend:
+                    self._warn("Fieldset missing legend", len(fieldsets) - with_legend)
+                        
                 # Test required field indicators
-                required_inputs = form.find_all(attrs={'required': True})
                 if required_inputs:
                     self._pass(f"Required fields marked ({len(required_inputs)})")
                     
                 # Test for error handling
-                error_elements = form.find_all(attrs={'role': 'alert'}) + \
-                               form.find_all(attrs={'aria-live': 'assertive'})
                 if error_elements:
                     self._pass("Error handling elements found")
                 else:
                     self._warn("No error handling elements detected")
                     
         # Test for autocomplete attributes
-        autocomplete_inputs = soup.find_all(attrs={'autocomplete': True})
+        autocomplete_inputs = tags['[autocomplete]']
         if autocomplete_inputs:
             self._pass(f"Autocomplete attributes found ({len(autocomplete_inputs)})")
 
-    async def _test_focus_management(self, soup):
+    async def _test_focus_management(self, tags):
         """Test focus management"""
         print("\n🎯 Testing Focus Management...")
         
-        # Test for focus indicators in CSS
-        css_content = ""
-        style_tags = soup.find_all('style')
-        link_tags = soup.find_all('link', rel='stylesheet')
-        
-        for style in style_tags:
-            css_content += style.get_text()
-            
-        # Check for focus styles
-        focus_styles = [':focus', ':focus-visible', ':focus-within']
-        found_focus_styles = [style for style in focus_styles if style in css_content]
+        # Check for focus indicators in embedded CSS
+        found_focus_styles = [style for style in FOCUS_STYLES if self._css_has(style)]
         
         if found_focus_styles:
             self._pass(f"Focus styles found: {', '.join(found_focus_styles)}")
@@ -310,15 +474,15 @@ class AccessibilityTester:
             self._warn("No focus styles detected in embedded CSS")
             
         # Check for focus-visible support
-        if ':focus-visible' in css_content:
+        if self._css_has(':focus-visible'):
             self._pass("Modern focus management (:focus-visible) detected")
 
-    async def _test_mobile_accessibility(self, soup):
+    async def _test_mobile_accessibility(self, tags):
         """Test mobile accessibility"""
         print("\n📱 Testing Mobile Accessibility...")
         
         # Test for viewport meta tag
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = next((meta for meta in tags['meta'] if meta.get('name') == 'viewport'), None)
         if viewport:
             content = viewport.get('content', '')
             if 'width=device-width' in content:
@@ -329,44 +493,46 @@ class AccessibilityTester:
             self._fail("Viewport meta tag missing")
             
         # Test for touch target sizes (approximate)
-        buttons = soup.find_all('button')
+        buttons = tags['button']
         if buttons:
             self._pass(f"Buttons found for touch interaction ({len(buttons)})")
             
         # Test for reduced motion support
-        css_content = ""
-        style_tags = soup.find_all('style')
-        for style in style_tags:
-            css_content += style.get_text()
-            
-        if 'prefers-reduced-motion' in css_content:
+        if self._css_has('prefers-reduced-motion'):
             self._pass("Reduced motion support detected")
         else:
             self._warn("No reduced motion support detected")
 
-    def _pass(self, message):
+    def _record(self, outcome, message, count):
+        """Record count checks with the same outcome as one message"""
+        if count != 1:
+            message = f"{message} (x{count})"
+        self.results[outcome].append(message)
+        self.results['total_tests'] += count
+        self._counts[outcome] += count
+        return message
+
+    def _report_ids(self, record, template, ids):
+        """Report one outcome for all element ids that share it (template takes the id list)"""
+        if ids:
+            record(template.format(', '.join(ids)), len(ids))
+
+    def _pass(self, message, count=1):
         """Record a passed test"""
-        self.results['passed'].append(message)
-        self.results['total_tests'] += 1
-        print(f"  ✅ {message}")
+        print(f"  ✅ {self._record('passed', message, count)}")
 
-    def _fail(self, message):
+    def _fail(self, message, count=1):
         """Record a failed test"""
-        self.results['failed'].append(message)
-        self.results['total_tests'] += 1
-        print(f"  ❌ {message}")
+        print(f"  ❌ {self._record('failed', message, count)}")
 
-    def _warn(self, message):
+    def _warn(self, message, count=1):
         """Record a warning"""
-        self.results['warnings'].append(message)
-        self.results['total_tests'] += 1
-        print(f"  ⚠️  {message}")
+        print(f"  ⚠️  {self._record('warnings', message, count)}")
 
     def _calculate_score(self):
         """Calculate accessibility score"""
-        passed = len(self.results['passed'])
-        failed = len(self.results['failed'])
-        warnings = len(self.results['warnings'])
+        passed = self._counts['passed']
+        warnings = self._counts['warnings']
         total = self.results['total_tests']
         
         if total > 0:
@@ -380,9 +546,9 @@ class AccessibilityTester:
         print("📊 ACCESSIBILITY TEST RESULTS")
         print("=" * 50)
         
-        passed = len(self.results['passed'])
-        failed = len(self.results['failed'])
-        warnings = len(self.results['warnings'])
+        passed = self._counts['passed']
+        failed = self._counts['failed']
+        warnings = self._counts['warnings']
         score = self.results['score']
         
         print(f"✅ Passed:   {passed}")
@@ -418,13 +584,13 @@ async def main():
     print(f"Testing accessibility for: {base_url}")
     print("Make sure the application is running first!")
     
-    tester = AccessibilityTester(base_url)
-    results = await tester.run_all_tests()
+    async with AccessibilityTester(base_url) as tester:
+        results = await tester.run_all_tests()
     
     # Save results to file
     results_file = Path("accessibility_test_results.json")
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    # orjson writes UTF-8 directly (same output as ensure_ascii=False, in C)
+    results_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         
     print(f"\n💾 Results saved to: {results_file}")
     
@@ -3,8 +3,10 @@
 Test script for the enhanced summarization functionality
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 def test_summarization_endpoints():
     """Test the summarization endpoints"""
@@ -25,17 +27,25 @@ def test_summarization_endpoints():
     그래서 Python을 배우시는 것을 강력히 추천드립니다!
     """
     
+    # One keep-alive session; its connection pool serves both concurrent endpoint calls
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    
     print("🧪 Summarization Endpoints Test")
     print("=" * 50)
     
+    # The two endpoints are independent: send both requests at once, then report in order
+    pool = ThreadPoolExecutor(max_workers=2)
+    key_future = pool.submit(session.post, f"{base_url}/summarize/key_summary",
+                             json={"text": test_text}, timeout=30)
+    curator_future = pool.submit(session.post, f"{base_url}/summarize/curator",
+                                 json={"text": test_text}, timeout=30)
+    pool.shutdown(wait=False)
+    
     # Test Key Summary endpoint
     print("\n📝 Testing Key Summary Endpoint...")
     try:
-        response = requests.post(
-            f"{base_url}/summarize/key_summary",
-            json={"text": test_text},
-            timeout=30
-        )
+        response = key_future.result()
         
         if response.status_code == 200:
             key_summary = response.json()
@@ -56,11 +66,7 @@ def test_summarization_endpoints():
     # Test Curator endpoint
     print("\n🎯 Testing Curator Endpoint...")
     try:
-        response = requests.post(
-            f"{base_url}/summarize/curator",
-            json={"text": test_text},
-            timeout=30
-        )
+        response = curator_future.result()
         
         if response.status_code == 200:
             curator_summary = response.json()
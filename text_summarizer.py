@@ -0,0 +1,444 @@
+"""
+텍스트 요약 모듈
+T5 한국어 요약 모델과 규칙 기반 요약을 제공합니다.
+"""
+import os
+import re
+import tempfile
+from collections import Counter
+import torch
+from filelock import FileLock
+from transformers import AutoConfig, AutoTokenizer, AutoModelForSeq2SeqLM
+
+
+# --- 요약 모델 로드 및 생성 ---
+# 더 작은 증류(distilled) 모델로 교체할 수 있도록 환경변수로 지정 가능
+SUMMARIZER_MODEL_NAME = os.getenv("SUMMARIZER_MODEL", "eenzeenee/t5-small-korean-summarization")
+# 요약 백엔드: torch (기본) 또는 ct2 (CTranslate2 int8, CPU에서 2-4배 빠름)
+SUMMARIZER_BACKEND = os.getenv("SUMMARIZER_BACKEND", "torch").lower()
+SUMMARIZER_CT2_DIR = os.getenv("SUMMARIZER_CT2_DIR", "ct2_summarizer")
+SUMMARIZER_COMPILE = os.getenv("SUMMARIZER_COMPILE", "false").lower() == "true"
+summarizer_device = "cuda" if torch.cuda.is_available() else "cpu"
+summarizer = None
+summarizer_tokenizer = None
+summarizer_prefix = ""
+summarizer_generate_kwargs = {}
+SUMMARIZER_BATCH_SIZE = int(os.getenv("SUMMARIZER_BATCH_SIZE", "8"))
+# 여러 워커가 동시에 시작할 때 모델 다운로드/로드를 직렬화하는 잠금 파일
+SUMMARIZER_LOCK_PATH = os.path.join(tempfile.gettempdir(), "t5_summarizer.lock")
+
+
+def _generate_torch(batch: list, max_length: int, min_length: int) -> list:
+    """transformers 모델로 배치 요약 생성"""
+    inputs = summarizer_tokenizer(batch,
+                                  max_length=512,
+                                  padding=True,
+                                  truncation=True,
+                                  return_tensors="pt").to(summarizer_device)
+    with torch.inference_mode():
+        output = summarizer.generate(**inputs,
+                                     max_length=max_length,
+                                     min_length=min_length,
+                                     num_beams=1,
+                                     do_sample=False,
+                                     **summarizer_generate_kwargs)
+    return summarizer_tokenizer.batch_decode(output, skip_special_tokens=True)
+
+
+def _generate_ct2(batch: list, max_length: int, min_length: int) -> list:
+    """CTranslate2 Translator로 배치 요약 생성"""
+    source_tokens = [
+        summarizer_tokenizer.convert_ids_to_tokens(
+            summarizer_tokenizer.encode(text, max_length=512, truncation=True))
+        for text in batch
+    ]
+    results = summarizer.translate_batch(source_tokens,
+                                         max_decoding_length=max_length,
+                                         min_decoding_length=min_length,
+                                         beam_size=1)
+    return [
+        summarizer_tokenizer.decode(
+            summarizer_tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+            skip_special_tokens=True)
+        for result in results
+    ]
+
+
+def summarize_texts(texts: list, max_length: int, min_length: int) -> list:
+    """T5 요약 모델로 여러 텍스트를 배치 요약 (입력 순서 유지)"""
+    generate = _generate_ct2 if SUMMARIZER_BACKEND == "ct2" else _generate_torch
+    # 길이가 비슷한 텍스트끼리 묶어 배치 내 패딩 낭비를 줄이고, 결과는 원래 순서로 복원
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    summaries = [None] * len(texts)
+    for start in range(0, len(order), SUMMARIZER_BATCH_SIZE):
+        indices = order[start:start + SUMMARIZER_BATCH_SIZE]
+        batch = [summarizer_prefix + texts[i] for i in indices]
+        for i, summary in zip(indices, generate(batch, max_length, min_length)):
+            summaries[i] = summary
+    return summaries
+
+
+def summarize_text(text: str, max_length: int, min_length: int) -> str:
+    """T5 요약 모델로 텍스트 하나를 요약"""
+    return summarize_texts([text], max_length=max_length, min_length=min_length)[0]
+
+
+def _compile_summarizer():
+    """torch.compile + static KV 캐시로 요약 모델 컴파일 및 워밍업"""
+    global summarizer_generate_kwargs
+    torch._inductor.config.fx_graph_cache = True
+    torch._inductor.config.coordinate_descent_tuning = True
+    eager_forward = summarizer.forward
+    summarizer.forward = torch.compile(summarizer.forward, mode="reduce-overhead")
+    summarizer_generate_kwargs = {"cache_implementation": "static"}
+    try:
+        # 컴파일 트리거를 위한 워밍업
+        for _ in range(3):
+            summarize_text("요약 모델 워밍업을 위한 문장입니다.", max_length=100, min_length=5)
+        print("⚡ 요약 모델 컴파일 완료 (static KV cache)")
+    except Exception as e:
+        # 모델/버전이 static cache를 지원하지 않으면 eager 모드로 복귀
+        summarizer.forward = eager_forward
+        summarizer_generate_kwargs = {}
+        print(f"⚠️  요약 모델 컴파일 실패, eager 모드로 실행합니다: {e}")
+
+
+def _load_torch_summarizer():
+    """transformers 요약 모델 로드"""
+    return AutoModelForSeq2SeqLM.from_pretrained(
+        SUMMARIZER_MODEL_NAME,
+        torch_dtype=torch.float16 if summarizer_device == "cuda" else torch.float32,
+        # 가중치를 메모리 맵으로 읽어 워커 간 페이지 캐시 공유
+        low_cpu_mem_usage=True
+    ).to(summarizer_device).eval()
+
+
+def _load_ct2_summarizer():
+    """CTranslate2 int8 요약 모델 로드
+
+    변환된 모델이 필요합니다:
+        ct2-transformers-converter --model eenzeenee/t5-small-korean-summarization
+            --output_dir ct2_summarizer --quantization int8
+    """
+    import ctranslate2
+
+    return ctranslate2.Translator(SUMMARIZER_CT2_DIR,
+                                  device=summarizer_device,
+                                  # GPU에서는 int8 가중치 + float16 연산
+                                  compute_type="int8_float16" if summarizer_device == "cuda" else "int8",
+                                  intra_threads=os.cpu_count() or 0)
+
+
+def load_summarizer() -> bool:
+    """요약 모델 로드 (실패하면 규칙 기반 요약으로 동작, 이미 로드되었으면 재사용)"""
+    global summarizer
+    if summarizer is not None:
+        return True
+    print("🔄 안정화된 한국어 요약 모델을 로드하는 중입니다...")
+    try:
+        with FileLock(SUMMARIZER_LOCK_PATH):
+            _load_summarizer_locked()
+        print(f"✅ T5 한국어 요약 모델 로드 완료! ({SUMMARIZER_BACKEND}, {summarizer_device})")
+        return True
+    except Exception as e:
+        summarizer = None
+        print(f"❌ 요약 모델 로드 실패: {e}")
+        print("   요약 기능 없이 애플리케이션을 시작합니다.")
+        return False
+
+
+def _load_summarizer_locked():
+    """토크나이저/모델 로드 (FileLock 안에서 호출)"""
+    global summarizer, summarizer_tokenizer, summarizer_prefix
+    # 안정적인 T5 모델 사용 (긴 텍스트 처리 가능)
+    summarizer_tokenizer = AutoTokenizer.from_pretrained(SUMMARIZER_MODEL_NAME)
+    # pipeline("summarization")과 동일하게 모델 설정의 입력 prefix 적용
+    summarizer_config = AutoConfig.from_pretrained(SUMMARIZER_MODEL_NAME)
+    task_params = (summarizer_config.task_specific_params or {}).get("summarization", {})
+    summarizer_prefix = task_params.get("prefix", summarizer_config.prefix or "")
+    if SUMMARIZER_BACKEND == "ct2":
+        summarizer = _load_ct2_summarizer()
+    else:
+        summarizer = _load_torch_summarizer()
+        if SUMMARIZER_COMPILE:
+            _compile_summarizer()
+            return
+    if summarizer_device == "cuda":
+        # CUDA 컨텍스트/커널 초기화를 첫 요청이 아닌 시작 시점에 처리
+        summarize_text("요약 모델 워밍업을 위한 문장입니다.", max_length=20, min_length=5)
+
+
+# --- 요약 처리 함수들 ---
+_PARAGRAPH_RE = re.compile(r"\n{2,}")
+# 소수점/URL("3.5", "youtube.com")에서 끊기지 않도록 공백이나 끝이 뒤따르는 마침표만 구분자로 사용
+# (구분자가 아닌 문자들의 연속을 한 번의 finditer로 찾아 중간 리스트를 만들지 않음)
+_SENTENCE_RE = re.compile(r"(?:[^.]|\.(?!\s|$))+")
+
+
+def split_paragraphs(text: str) -> list:
+    """빈 줄 기준으로 문단 분할 (빈 줄이 없으면 줄 단위로 분할)"""
+    paragraphs = _PARAGRAPH_RE.split(text)
+    if len(paragraphs) == 1:
+        return [p.strip() for p in text.split('\n') if len(p.strip()) > 10]
+    return [p.strip() for p in paragraphs if p.strip()]
+
+
+def split_sentences(text: str, min_length: int = 0) -> list:
+    """마침표 기준으로 문장 분할 (min_length보다 긴 문장만 반환)"""
+    return [s for s in (m.group().strip() for m in _SENTENCE_RE.finditer(text)) if s and len(s) > min_length]
+
+
+def rule_based_key_points(text: str) -> list:
+    """규칙 기반 핵심요약 (요약 모델이 없을 때)"""
+    # Split by double newlines first, then by single newlines if no double newlines
+    paragraphs = split_paragraphs(text)
+    
+    summaries = []
+    for para in paragraphs:
+        if len(para.strip()) < 30:  # 너무 짧은 문단은 그냥 사용
+            summary_text = para.strip()
+        else:
+            # Simple extractive summarization: take first and most important sentences
+            sentences = split_sentences(para)
+            if len(sentences) <= 2:
+                summary_text = para.strip()
+            else:
+                # Take first sentence and longest sentence (likely contains key info)
+                first_sentence = sentences[0] + '.'
+                longest_sentence = max(sentences[1:], key=len, default='') + ('.' if sentences[1:] else '')
+                summary_text = first_sentence + (f' {longest_sentence}' if longest_sentence and longest_sentence != '.' else '')
+        
+        if summary_text and len(summary_text.strip()) > 5:
+            summaries.append({"paragraph_summary": summary_text.strip()})
+    
+    return summaries
+
+
+def t5_key_points(text: str) -> list:
+    """T5 모델 기반 핵심요약"""
+    # Split by double newlines first, then by single newlines if needed
+    paragraphs = split_paragraphs(text)
+        
+    # 긴 문단만 모아서 한 번에 배치 요약 (너무 짧은 문단은 그냥 사용)
+    # 텍스트 길이 제한 (T5 모델 안정성)
+    to_summarize = [para[:800] for para in paragraphs if len(para) >= 50]
+    batch_summaries = iter(summarize_texts(to_summarize, max_length=120, min_length=25))
+
+    summaries = []
+    for para in paragraphs:
+        summary_text = para if len(para) < 50 else next(batch_summaries)
+        
+        if summary_text and len(summary_text.strip()) > 5:
+            summaries.append({"paragraph_summary": summary_text.strip()})
+            
+    return summaries
+
+
+def rule_based_curator(text: str) -> dict:
+    """규칙 기반 큐레이터 요약 (요약 모델이 없을 때)"""
+    text = text.strip()
+    sentences = split_sentences(text, min_length=10)
+    
+    # Generate title from first meaningful sentence or first few words
+    if sentences:
+        title_candidate = sentences[0]
+        if len(title_candidate) > 100:
+            # Take first part if too long
+            words = title_candidate.split()[:10]
+            title = ' '.join(words) + ('...' if len(words) == 10 else '')
+        else:
+            title = title_candidate
+    else:
+        title = "YouTube 영상 요약"
+    
+    # Generate one line summary from longest sentences
+    if len(sentences) >= 2:
+        summary_candidates = sorted(sentences[:5], key=len, reverse=True)[:2]
+        one_line_summary = '. '.join(summary_candidates) + '.'
+    else:
+        one_line_summary = sentences[0] if sentences else "영상 내용 요약"
+    
+    # Extract key points from longest/most informative sentences
+    if len(sentences) >= 3:
+        key_point_candidates = sorted(sentences, key=len, reverse=True)[:3]
+        key_points = [point + ('.' if not point.endswith('.') else '') for point in key_point_candidates]
+    else:
+        key_points = [s + ('.' if not s.endswith('.') else '') for s in sentences[:3]]
+        
+    # Ensure we have at least something
+    if not key_points:
+        key_points = ["영상의 주요 내용을 다룹니다."]
+
+    curated_summary = {
+        "title": title,
+        "one_line_summary": one_line_summary,
+        "key_points": key_points
+    }
+    return curated_summary
+
+
+# 핵심 포인트 중복 판정 기준 (단어 집합 Jaccard 유사도가 이보다 크면 비슷한 문장으로 보고 제외)
+KEY_POINT_MAX_SIMILARITY = 0.5
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    """두 단어 집합의 Jaccard 유사도"""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def t5_curator(text: str) -> dict:
+    """T5 모델 기반 큐레이터 요약"""
+    # T5 모델 안정성을 위한 텍스트 제한
+    text_truncated = text[:1000] if len(text) > 1000 else text
+    full_summary = summarize_text(text_truncated, max_length=200, min_length=50)
+    
+    # 제목 생성
+    title_text = text[:500]
+    title = summarize_text(title_text, max_length=60, min_length=15)
+
+    # 핵심 포인트 추출 - 개선된 방법
+    sentences = split_sentences(text, min_length=20)
+    
+    # Get meaningful sentences for key points
+    if len(sentences) >= 3:
+        # Sort by length and take diverse content
+        key_point_candidates = sorted(sentences, key=len, reverse=True)[:6]
+        candidate_tokens = [frozenset(candidate.split()) for candidate in key_point_candidates]
+        # Select 3 most diverse points
+        key_points = []
+        chosen_tokens = []
+        for candidate, tokens in zip(key_point_candidates, candidate_tokens):
+            if len(key_points) >= 3:
+                break
+            # Avoid very similar points (단어 집합 Jaccard 유사도 기준)
+            if all(jaccard(tokens, existing) <= KEY_POINT_MAX_SIMILARITY for existing in chosen_tokens):
+                chosen_tokens.append(tokens)
+                key_points.append(candidate + ('.' if not candidate.endswith('.') else ''))
+    else:
+        key_points = [s + ('.' if not s.endswith('.') else '') for s in sentences[:3]]
+        
+    # Ensure we have at least something
+    if not key_points:
+        key_points = ["영상의 주요 내용을 다룹니다."]
+
+    curated_summary = {
+        "title": title,
+        "one_line_summary": full_summary,
+        "key_points": key_points
+    }
+    return curated_summary
+
+
+# 타임라인 키워드 추출용 불용어
+STOP_WORDS = frozenset({'을', '를', '이', '가', '은', '는', '의', '에', '에서', '으로', '와', '과', '하고', '그리고', '또한', '하지만', '그런데', '그래서', '따라서', '즉', '것', '수', '때', '곳', '등'})
+
+
+def rule_based_timeline(text: str) -> list:
+    """규칙 기반 타임라인 요약"""
+    text = text.strip()
+    if not text or len(text) < 20:
+        return []
+    
+    # 텍스트를 문단으로 분할 (더 긴 문단으로)
+    paragraphs = []
+    sentences = split_sentences(text, min_length=15)
+    
+    # 문장들을 그룹화하여 단락 생성 (약 3-5 문장씩)
+    current_paragraph = []
+    for sentence in sentences:
+        current_paragraph.append(sentence)
+        # 문단 길이가 적당하거나 키워드 변화가 감지되면 새 문단 시작
+        if len(current_paragraph) >= 4 or len(' '.join(current_paragraph)) > 300:
+            paragraphs.append('. '.join(current_paragraph) + '.')
+            current_paragraph = []
+    
+    # 남은 문장들 추가
+    if current_paragraph:
+        paragraphs.append('. '.join(current_paragraph) + '.')
+    
+    timeline_sections = []
+    
+    for i, paragraph in enumerate(paragraphs):
+        if len(paragraph.strip()) < 20:  # 너무 짧은 문단 제외
+            continue
+            
+        # 타임스탬프 생성 (대략적으로)
+        timestamp = f"{(i * 3) + 1}-{(i + 1) * 3}분"
+        
+        sentences_in_paragraph = split_sentences(paragraph)
+
+        # 소타이틀 생성 (첫 번째 문장의 핵심 추출)
+        first_sentence = sentences_in_paragraph[0] if sentences_in_paragraph else ''
+        if len(first_sentence) > 60:
+            words = first_sentence.split()[:8]
+            subtitle = ' '.join(words) + '...'
+        else:
+            subtitle = first_sentence
+        
+        # 단락 요약 (핵심 문장들 선별)
+        if len(sentences_in_paragraph) > 1:
+            # 가장 긴 2-3개 문장을 핵심으로 선택
+            important_sentences = sorted(sentences_in_paragraph[:4], key=len, reverse=True)[:2]
+            summary = '. '.join(important_sentences) + '.'
+        else:
+            summary = paragraph
+        
+        # 키워드 추출 (불용어 제거 후 빈도 높은 단어들을 키워드로, 상위 3-5개)
+        # 문단은 위에서 약 300자 단위로 묶이므로 C로 구현된 Counter로 충분 (Numba 등 JIT은 토큰을
+        # 정수로 바꾸는 Python 비용이 더 커서 이득이 없음)
+        word_freq = Counter(w for w in paragraph.lower().split() if len(w) > 1 and w not in STOP_WORDS)
+        keyword_list = [word for word, count in word_freq.most_common(4) if count > 1]
+        
+        # 한마디 정리 (구어체로)
+        if len(sentences_in_paragraph) > 0:
+            key_sentence = sentences_in_paragraph[0]
+            if "합니다" in key_sentence or "습니다" in key_sentence:
+                oneline = key_sentence.replace("합니다", "해요").replace("습니다", "예요")
+            else:
+                oneline = key_sentence + "라는 얘기에요"
+        else:
+            oneline = "핵심 내용이에요"
+        
+        timeline_sections.append({
+            "timestamp": timestamp,
+            "subtitle": subtitle,
+            "summary": summary,
+            "keywords": keyword_list,
+            "oneline_summary": oneline
+        })
+    
+    return timeline_sections[:8]  # 최대 8개 섹션으로 제한
+
+
+# --- 엔드포인트별 요약 (모델 유무에 따라 T5/규칙 기반 선택) ---
+def key_points_summary(text: str) -> list:
+    """핵심요약 - T5 모델 우선, 없으면 규칙 기반"""
+    return t5_key_points(text) if summarizer else rule_based_key_points(text)
+
+
+def curator_summary(text: str) -> dict:
+    """큐레이터 요약 - T5 모델 우선, 없으면 규칙 기반"""
+    return t5_curator(text) if summarizer else rule_based_curator(text)
+
+
+def timeline_summary(text: str) -> list:
+    """타임라인 요약 - 규칙 기반"""
+    return rule_based_timeline(text)
+
+
+SUMMARY_KINDS = {
+    "key_summary": key_points_summary,
+    "curator": curator_summary,
+    "timeline_summary": timeline_summary,
+}
+
+
+def run_summary(kind: str, text: str):
+    """요약 종류별 실행 (프로세스 풀에서 pickle 가능한 진입점)"""
+    return SUMMARY_KINDS[kind](text)
+
+
+def init_worker():
+    """프로세스 풀 워커 초기화 - 워커마다 모델을 한 번만 로드"""
+    load_summarizer()
@@ -4,23 +4,226 @@ Build Validation Script for YouTube Audio Transcriber
 Validates the dashboard components and accessibility improvements
 """
 
+import mmap
 import os
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import json
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    # Lexbor (C) HTML5 parser: an order of magnitude faster than bs4 for building and walking the tree
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # libxml2 (C) parser, driven SAX-style through a parser target when selectolax is missing
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # CSS tokenizer: lets the CSS checks look at selectors, @-rule preludes and property names only
+    import tinycss2
+except ImportError:
+    tinycss2 = None
+
+REQUIRED_FILES = (
+    'app.py',
+    'requirements.txt',
+    'static/css/dashboard.css',
+    'static/js/dashboard-components.js',
+    'templates/dashboard.html',
+    'test_accessibility.py'
+)
+SEMANTIC_ELEMENTS = ('main', 'header', 'footer', 'section', 'article', 'nav')
+
+# bs4 fallback (neither selectolax nor lxml installed): only the tags _validate_templates
+# queries are built into the tree. bs4 filters top-level tags only (a kept tag keeps its whole
+# subtree), so <html>/<body> must stay out of the list; attributes on skipped tags are still
+# caught by the raw-HTML substring fallback.
+TEMPLATE_STRAINER = SoupStrainer(
+    list(SEMANTIC_ELEMENTS) + ['form', 'label', 'fieldset', 'input', 'select', 'textarea', 'a', 'meta']
+)
+
+# Checklists: (needle, description) pairs looked up in each file's content
+CSS_ACCESSIBILITY_FEATURES = (
+    ('focus-visible', 'Modern focus management'),
+    ('prefers-reduced-motion', 'Reduced motion support'),
+    ('prefers-color-scheme', 'Dark mode support'),
+    ('prefers-contrast', 'High contrast support'),
+    ('.sr-only', 'Screen reader only class')
+)
+JS_COMPONENTS = ('FormComponents', 'StatusComponents', 'ResultComponents')
+TEMPLATE_ACCESSIBILITY_ATTRS = (
+    ('aria-label', 'ARIA labels'),
+    ('aria-describedby', 'ARIA descriptions'),
+    ('aria-live', 'ARIA live regions'),
+    ('role', 'ARIA roles'),
+    ('lang', 'Language attribute')
+)
+TEMPLATE_META_CHECKS = (
+    ('viewport', 'Responsive viewport'),
+    ('description', 'Meta description'),
+    ('charset="UTF-8"', 'UTF-8 encoding')
+)
+
+# Every literal searched for in a file, matched in one regex pass over its content
+CSS_NEEDLES = (':root', '--primary-color') + tuple(feature for feature, _ in CSS_ACCESSIBILITY_FEATURES)
+JS_NEEDLES = ('a11y', 'announce') + JS_COMPONENTS
+TEMPLATE_NEEDLES = (
+    tuple(check for check, _ in TEMPLATE_META_CHECKS)
+    + ('aria-live-announcer', 'keydown', 'preload', 'PerformanceObserver', 'serviceWorker')
+)
+# HTML attribute names are case-insensitive: the raw-text fallback for attributes on tags the bs4
+# strainer skips (e.g. <html LANG="ko">) must match them the same way the parsers do
+TEMPLATE_NEEDLES_NOCASE = (
+    tuple(f'{attr}=' for attr, _ in TEMPLATE_ACCESSIBILITY_ATTRS)
+    + ('skip', 'content', 'keyboard')
+)
+
+
+def compile_needles(needles, ignore_case=(), as_bytes=False):
+    """One regex finding, at every position, the longest needle that starts there
+
+    The lookahead keeps matches from consuming text, so overlapping needles are all seen;
+    a needle that is a prefix of a longer one is recovered from the longer hit in scan_needles.
+    With as_bytes the pattern runs directly over raw file bytes (e.g. an mmap).
+    """
+    alternatives = sorted(needles + ignore_case, key=len, reverse=True)
+    pattern = '(?=(' + '|'.join(
+        f'(?i:{re.escape(needle)})' if needle in ignore_case else re.escape(needle)
+        for needle in alternatives
+    ) + '))'
+    return re.compile(pattern.encode() if as_bytes else pattern)
+
+
+def scan_needles(pattern, content, needles, ignore_case=()):
+    """Set of needles (and ignore_case needles) that occur in content, from one regex pass"""
+    hits = set(pattern.findall(content))
+    if isinstance(pattern.pattern, bytes):
+        hits = {hit.decode('utf-8', 'replace') for hit in hits}
+    found = {needle for needle in needles if any(needle in hit for hit in hits)}
+    if ignore_case:
+        lowered = {hit.lower() for hit in hits}
+        found.update(needle for needle in ignore_case if any(needle in hit for hit in lowered))
+    return found
+
+
+CSS_NEEDLES_RE = compile_needles(CSS_NEEDLES)
+# Files only searched for needles (the JS, and the CSS without tinycss2) are scanned as mapped
+# bytes: no full read or decode into a str. The template is read as text since it is parsed too.
+CSS_NEEDLES_BYTES_RE = compile_needles(CSS_NEEDLES, as_bytes=True)
+JS_NEEDLES_RE = compile_needles(JS_NEEDLES, as_bytes=True)
+TEMPLATE_NEEDLES_RE = compile_needles(TEMPLATE_NEEDLES, TEMPLATE_NEEDLES_NOCASE)
+
+
+def _css_text(tokens):
+    """Serialize component values, leaving comments out"""
+    return tinycss2.serialize(token for token in tokens if token.type != 'comment')
+
+
+def css_features(css_content):
+    """CSS_NEEDLES present in a stylesheet
+
+    With tinycss2 the stylesheet is parsed once and only selectors, @-rule preludes and declared
+    property names are searched, so comments and property values (e.g. url() or content strings)
+    can't produce false positives. Without it, the raw text is scanned.
+    """
+    if tinycss2 is None:
+        return scan_needles(CSS_NEEDLES_RE, css_content, CSS_NEEDLES)
+
+    structure = []
+    rules = tinycss2.parse_stylesheet(css_content, skip_comments=True, skip_whitespace=True)
+    while rules:
+        rule = rules.pop()
+        if rule.type == 'declaration':
+            structure.append(rule.name)
+            continue
+        if rule.type == 'qualified-rule':
+            structure.append(_css_text(rule.prelude))
+        elif rule.type == 'at-rule':
+            structure.append(_css_text(rule.prelude))
+        else:  # parse error
+            continue
+        if rule.content is not None:
+            # Declarations plus nested rules (@media bodies, CSS nesting)
+            rules.extend(tinycss2.parse_blocks_contents(rule.content, skip_comments=True, skip_whitespace=True))
+    return scan_needles(CSS_NEEDLES_RE, '\n'.join(structure), CSS_NEEDLES)
+
+
+# Directory listings are shared across BuildValidator runs in one process (watch mode, pre-commit
+# loops) for up to this many seconds; BuildValidator.invalidate_cache() drops them immediately
+LISTING_TTL = 2.0
+
+
+@lru_cache(maxsize=256)
+def _list_dir(directory, ttl_bucket):
+    """Entry names of a directory mapped to DirEntry.is_file(), from one os.scandir (empty if
+    it doesn't exist). is_file() answers from the d_type scandir already returned; only
+    symlinks cost an extra stat. ttl_bucket only keys the cache, so entries expire with it."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_file() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def list_dir(directory):
+    """Cached listing of a directory, rescanned once the current LISTING_TTL window has passed"""
+    return _list_dir(directory, int(time.monotonic() // LISTING_TTL))
+
+
+class TagCounter:
+    """Counts start tags and attribute names; used as an lxml parser target, so no tree is built"""
+
+    def __init__(self):
+        self.tag_counts = Counter()
+        self.attr_counts = Counter()
+
+    def start(self, tag, attrib):
+        self.tag_counts[tag] += 1
+        if attrib:
+            self.attr_counts.update(attrib.keys())
+
+    def close(self):
+        return self.tag_counts, self.attr_counts
 
 
 class BuildValidator:
-    def __init__(self, project_root="."):
+    def __init__(self, project_root=".", store_messages=True):
         self.project_root = Path(project_root)
+        # With store_messages=False only the counts are kept (scoring and summary still work)
+        self.store_messages = store_messages
         self.results = {
             'passed': [],
             'failed': [],
             'warnings': [],
             'score': 0
         }
+        # Each file is read (and the template parsed) once, no matter how many validators use it
+        self._file_cache = {}
+        self._tag_counts_cache = {}
+        self._scan_cache = {}
+        self._counts = {'passed': 0, 'failed': 0, 'warnings': 0}
+        # Directory listings from one os.scandir per directory, used for existence checks
+        self._dir_listings = {}
+        # Validators run on worker threads: each cache entry is computed under its own lock, and
+        # a running validator's outcomes and output go to its thread's section (see _run_section)
+        self._cache_locks = {}
+        self._section = threading.local()
 
     def validate_all(self):
         """Run all validation checks"""
@@ -28,11 +231,23 @@ class BuildValidator:
         print("=" * 50)
         print("📋 Validating Dashboard Components & Accessibility")
         
-        self._validate_project_structure()
-        self._validate_static_assets()
-        self._validate_templates()
-        self._validate_accessibility_features()
-        self._validate_performance_optimizations()
+        validators = (
+            self._validate_project_structure,
+            self._validate_static_assets,
+            self._validate_templates,
+            self._validate_accessibility_features,
+            self._validate_performance_optimizations
+        )
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sections = [pool.submit(self._run_section, validate) for validate in validators]
+            # Merge in submission order so output and results read as if run sequentially
+            for future in sections:
+                section = future.result()
+                for line in section.pop('output'):
+                    print(line)
+                for outcome, messages in section.items():
+                    for message in messages:
+                        self._record(outcome, message)
         
         self._calculate_score()
         self._print_results()
@@ -41,87 +256,64 @@ class BuildValidator:
 
     def _validate_project_structure(self):
         """Validate project structure"""
-        print("\n📁 Validating Project Structure...")
+        self._log("\n📁 Validating Project Structure...")
         
-        required_files = [
-            'app.py',
-            'requirements.txt',
-            'static/css/dashboard.css',
-            'static/js/dashboard-components.js',
-            'templates/dashboard.html',
-            'test_accessibility.py'
-        ]
-        
-        for file_path in required_files:
-            if (self.project_root / file_path).exists():
+        for file_path in REQUIRED_FILES:
+            path = self.project_root / file_path
+            if self._is_file(path):
                 self._pass(f"Found: {file_path}")
+            elif self._exists(path):
+                self._fail(f"Not a file: {file_path}")
             else:
                 self._fail(f"Missing: {file_path}")
 
     def _validate_static_assets(self):
         """Validate static assets"""
-        print("\n🎨 Validating Static Assets...")
+        self._log("\n🎨 Validating Static Assets...")
         
         # Check CSS file
         css_path = self.project_root / "static/css/dashboard.css"
-        if css_path.exists():
-            css_content = css_path.read_text()
+        if self._is_file(css_path):
+            css_found = self._css_features(css_path)
             
             # Check for design system variables
-            if ':root' in css_content and '--primary-color' in css_content:
+            if ':root' in css_found and '--primary-color' in css_found:
                 self._pass("CSS design system with custom properties")
             else:
                 self._fail("CSS design system missing")
                 
             # Check for accessibility features
-            accessibility_features = [
-                ('focus-visible', 'Modern focus management'),
-                ('prefers-reduced-motion', 'Reduced motion support'),
-                ('prefers-color-scheme', 'Dark mode support'),
-                ('prefers-contrast', 'High contrast support'),
-                ('.sr-only', 'Screen reader only class')
-            ]
-            
-            for feature, description in accessibility_features:
-                if feature in css_content:
-                    self._pass(f"CSS: {description}")
-                else:
-                    self._warn(f"CSS: Missing {description}")
+            self._report_checklist("CSS", CSS_ACCESSIBILITY_FEATURES, css_found)
                     
         # Check JavaScript file
         js_path = self.project_root / "static/js/dashboard-components.js"
-        if js_path.exists():
-            js_content = js_path.read_text()
+        if self._is_file(js_path):
+            js_found = self._scan(js_path, JS_NEEDLES_RE, JS_NEEDLES)
             
             # Check for accessibility utilities
-            if 'a11y' in js_content and 'announce' in js_content:
+            if 'a11y' in js_found and 'announce' in js_found:
                 self._pass("JavaScript: Accessibility utilities")
             else:
                 self._fail("JavaScript: Missing accessibility utilities")
                 
             # Check for modular architecture
-            components = ['FormComponents', 'StatusComponents', 'ResultComponents']
-            for component in components:
-                if component in js_content:
+            for component in JS_COMPONENTS:
+                if component in js_found:
                     self._pass(f"JavaScript: {component} found")
                 else:
                     self._fail(f"JavaScript: Missing {component}")
 
     def _validate_templates(self):
         """Validate HTML templates"""
-        print("\n📄 Validating HTML Templates...")
+        self._log("\n📄 Validating HTML Templates...")
         
         template_path = self.project_root / "templates/dashboard.html"
-        if template_path.exists():
-            html_content = template_path.read_text()
-            soup = BeautifulSoup(html_content, 'html.parser')
+        if self._is_file(template_path):
+            html_found = self._scan_template(template_path)
+            tag_counts, attr_counts = self._tag_counts(template_path)
             
             # Check semantic HTML
-            semantic_elements = ['main', 'header', 'footer', 'section', 'article', 'nav']
-            found_semantic = []
-            for element in semantic_elements:
-                if soup.find(element):
-                    found_semantic.append(element)
+            found_semantic = [element for element in SEMANTIC_ELEMENTS if tag_counts[element]]
                     
             if len(found_semantic) >= 3:
                 self._pass(f"Semantic HTML: {', '.join(found_semantic)}")
@@ -129,120 +321,210 @@ class BuildValidator:
                 self._warn(f"Limited semantic HTML: {', '.join(found_semantic)}")
                 
             # Check accessibility attributes
-            accessibility_attrs = [
-                ('aria-label', 'ARIA labels'),
-                ('aria-describedby', 'ARIA descriptions'),
-                ('aria-live', 'ARIA live regions'),
-                ('role', 'ARIA roles'),
-                ('lang', 'Language attribute')
-            ]
-            
-            for attr, description in accessibility_attrs:
-                if soup.find(attrs={attr: True}) or f'{attr}=' in html_content:
-                    self._pass(f"HTML: {description}")
-                else:
-                    self._warn(f"HTML: Missing {description}")
+            found = {attr for attr, _ in TEMPLATE_ACCESSIBILITY_ATTRS
+                     if attr_counts[attr] or f'{attr}=' in html_found}
+            self._report_checklist("HTML", TEMPLATE_ACCESSIBILITY_ATTRS, found)
                     
             # Check form accessibility
-            forms = soup.find_all('form')
-            if forms:
-                labels = soup.find_all('label')
-                required_fields = soup.find_all(attrs={'required': True})
-                fieldsets = soup.find_all('fieldset')
+            if tag_counts['form']:
+                labels = tag_counts['label']
+                required_fields = attr_counts['required']
+                fieldsets = tag_counts['fieldset']
                 
                 if labels:
-                    self._pass(f"Form: {len(labels)} labels found")
+                    self._pass(f"Form: {labels} labels found")
                 if required_fields:
-                    self._pass(f"Form: {len(required_fields)} required fields marked")
+                    self._pass(f"Form: {required_fields} required fields marked")
                 if fieldsets:
-                    self._pass(f"Form: {len(fieldsets)} fieldsets for grouping")
+                    self._pass(f"Form: {fieldsets} fieldsets for grouping")
                     
             # Check skip link
-            if 'skip' in html_content.lower() and 'content' in html_content.lower():
+            if 'skip' in html_found and 'content' in html_found:
                 self._pass("HTML: Skip to content link")
             else:
                 self._warn("HTML: Missing skip to content link")
 
     def _validate_accessibility_features(self):
         """Validate specific accessibility improvements"""
-        print("\n♿ Validating Accessibility Features...")
+        self._log("\n♿ Validating Accessibility Features...")
         
         template_path = self.project_root / "templates/dashboard.html"
-        if template_path.exists():
-            html_content = template_path.read_text()
+        if self._is_file(template_path):
+            html_found = self._scan_template(template_path)
             
             # Check meta tags
-            meta_checks = [
-                ('viewport', 'Responsive viewport'),
-                ('description', 'Meta description'),
-                ('charset="UTF-8"', 'UTF-8 encoding')
-            ]
-            
-            for check, description in meta_checks:
-                if check in html_content:
-                    self._pass(f"Meta: {description}")
-                else:
-                    self._warn(f"Meta: Missing {description}")
+            self._report_checklist("Meta", TEMPLATE_META_CHECKS, html_found)
                     
             # Check for aria-live announcer
-            if 'aria-live-announcer' in html_content:
+            if 'aria-live-announcer' in html_found:
                 self._pass("ARIA: Live announcer element")
             else:
                 self._warn("ARIA: Missing live announcer")
                 
             # Check for keyboard navigation support
-            if 'keydown' in html_content or 'keyboard' in html_content.lower():
+            if 'keydown' in html_found or 'keyboard' in html_found:
                 self._pass("JavaScript: Keyboard navigation support")
             else:
                 self._warn("JavaScript: Limited keyboard navigation")
 
     def _validate_performance_optimizations(self):
         """Validate performance optimizations"""
-        print("\n⚡ Validating Performance Features...")
+        self._log("\n⚡ Validating Performance Features...")
         
         template_path = self.project_root / "templates/dashboard.html"
-        if template_path.exists():
-            html_content = template_path.read_text()
+        if self._is_file(template_path):
+            html_found = self._scan_template(template_path)
             
             # Check for preload directives
-            if 'preload' in html_content:
+            if 'preload' in html_found:
                 self._pass("Performance: Resource preloading")
             else:
                 self._warn("Performance: No resource preloading")
                 
             # Check for performance monitoring
-            if 'PerformanceObserver' in html_content:
+            if 'PerformanceObserver' in html_found:
                 self._pass("Performance: Performance monitoring")
             else:
                 self._warn("Performance: No performance monitoring")
                 
             # Check for service worker registration
-            if 'serviceWorker' in html_content:
+            if 'serviceWorker' in html_found:
                 self._pass("Performance: Service worker ready")
             else:
                 self._warn("Performance: No service worker")
 
+    def _run_section(self, validate):
+        """Run one validator, collecting its outcomes and output in a section dict it returns"""
+        section = self._section.current = {'passed': [], 'failed': [], 'warnings': [], 'output': []}
+        try:
+            validate()
+        finally:
+            self._section.current = None
+        return section
+
+    def _cached(self, cache, key, compute):
+        """Return cache[key], computing it once even when several validator threads ask at once"""
+        if key in cache:
+            return cache[key]
+        with self._cache_locks.setdefault((id(cache), key), threading.Lock()):
+            if key not in cache:
+                cache[key] = compute()
+            return cache[key]
+
+    def _listing(self, directory):
+        """Cached {entry name: is a regular file} listing of a directory"""
+        return self._cached(self._dir_listings, directory, lambda: list_dir(directory))
+
+    def _exists(self, path):
+        """Check existence against a cached listing of the parent directory"""
+        return path.name in self._listing(path.parent)
+
+    def _is_file(self, path):
+        """Check that path is a regular file (or a symlink to one) against the cached listing"""
+        return self._listing(path.parent).get(path.name, False)
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop the directory listings shared across runs (e.g. after files were added or removed)"""
+        _list_dir.cache_clear()
+
+    def _read(self, path):
+        """Return the file's text, reading it from disk only once"""
+        return self._cached(self._file_cache, path, path.read_text)
+
+    def _tag_counts(self, path):
+        """Tag-name and attribute-name counts for an HTML file, from one parse (cached per file)"""
+        return self._cached(self._tag_counts_cache, path, lambda: self._count_tags(self._read(path)))
+
+    @staticmethod
+    def _count_tags(content):
+        """Tag-name and attribute-name counts from the fastest available parser"""
+        counter = TagCounter()
+        if LexborHTMLParser is not None:
+            for node in LexborHTMLParser(content).root.traverse():
+                counter.start(node.tag, node.attributes)
+        elif etree is not None:
+            # Event-driven: the target sees each start tag and no tree is built
+            etree.fromstring(content, etree.HTMLParser(target=counter))
+        else:
+            for tag in BeautifulSoup(content, 'html.parser', parse_only=TEMPLATE_STRAINER).find_all(True):
+                counter.start(tag.name, tag.attrs)
+        return counter.close()
+
+    def _scan(self, path, pattern, needles, ignore_case=()):
+        """Needles found in the file, from one regex pass over its content (cached per file);
+        a bytes pattern scans the memory-mapped file, a str pattern the cached text"""
+        if isinstance(pattern.pattern, bytes):
+            return self._cached(self._scan_cache, path,
+                                lambda: self._scan_mapped(path, pattern, needles, ignore_case))
+        return self._cached(self._scan_cache, path,
+                            lambda: scan_needles(pattern, self._read(path), needles, ignore_case))
+
+    @staticmethod
+    def _scan_mapped(path, pattern, needles, ignore_case=()):
+        """scan_needles over a read-only mmap of the file (an empty file can't be mapped: no needles)"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return scan_needles(pattern, mapped, needles, ignore_case)
+
+    def _css_features(self, path):
+        """CSS_NEEDLES present in the stylesheet (cached per file)"""
+        if tinycss2 is None:
+            return self._scan(path, CSS_NEEDLES_BYTES_RE, CSS_NEEDLES)
+        return self._cached(self._scan_cache, path, lambda: css_features(self._read(path)))
+
+    def _scan_template(self, path):
+        """Template needles found in the dashboard template, shared by the three template validators"""
+        return self._scan(path, TEMPLATE_NEEDLES_RE, TEMPLATE_NEEDLES, TEMPLATE_NEEDLES_NOCASE)
+
+    def _report_checklist(self, label, checklist, found):
+        """Record a pass for each (key, description) whose key was found, a warning otherwise"""
+        for key, description in checklist:
+            if key in found:
+                self._pass(f"{label}: {description}")
+            else:
+                self._warn(f"{label}: Missing {description}")
+
+    def _record(self, outcome, message):
+        """Count a validation outcome, keeping its message unless store_messages is off"""
+        section = getattr(self._section, 'current', None)
+        if section is not None:
+            section[outcome].append(message)
+            return
+        self._counts[outcome] += 1
+        if self.store_messages:
+            self.results[outcome].append(message)
+
+    def _log(self, line):
+        """Print a line, or buffer it in the running validator's section"""
+        section = getattr(self._section, 'current', None)
+        if section is not None:
+            section['output'].append(line)
+        else:
+            print(line)
+
     def _pass(self, message):
         """Record a passed validation"""
-        self.results['passed'].append(message)
-        print(f"  ✅ {message}")
+        self._record('passed', message)
+        self._log(f"  ✅ {message}")
 
     def _fail(self, message):
         """Record a failed validation"""
-        self.results['failed'].append(message)
-        print(f"  ❌ {message}")
+        self._record('failed', message)
+        self._log(f"  ❌ {message}")
 
     def _warn(self, message):
         """Record a warning"""
-        self.results['warnings'].append(message)
-        print(f"  ⚠️  {message}")
+        self._record('warnings', message)
+        self._log(f"  ⚠️  {message}")
 
     def _calculate_score(self):
         """Calculate build validation score"""
-        passed = len(self.results['passed'])
-        failed = len(self.results['failed'])
-        warnings = len(self.results['warnings'])
-        total = passed + failed + warnings
+        passed = self._counts['passed']
+        warnings = self._counts['warnings']
+        total = passed + self._counts['failed'] + warnings
         
         if total > 0:
             # Score: pass = 1, warning = 0.5, fail = 0
@@ -255,9 +537,9 @@ class BuildValidator:
         print("📊 BUILD VALIDATION RESULTS")
         print("=" * 50)
         
-        passed = len(self.results['passed'])
-        failed = len(self.results['failed'])
-        warnings = len(self.results['warnings'])
+        passed = self._counts['passed']
+        failed = self._counts['failed']
+        warnings = self._counts['warnings']
         score = self.results['score']
         
         print(f"✅ Passed:   {passed}")
@@ -290,13 +572,16 @@ def main():
     results = validator.validate_all()
     
     # Save results
-    with open('build_validation_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        Path('build_validation_results.json').write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open('build_validation_results.json', 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"\n💾 Results saved to: build_validation_results.json")
     
     # Exit code based on failures
-    if len(results['failed']) > 0:
+    if validator._counts['failed'] > 0:
         sys.exit(1)
     else:
         sys.exit(0)